@@ -11,19 +11,33 @@ CHANGES:
 - Enhanced health checks with backend health information
 - Improved error handling and logging
 """
+import asyncio
 import os
 import sys
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import Response
+
+try:
+    import orjson  # noqa: F401  (ORJSONResponse needs it)
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
 
 # Add parent directory to path for shared imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from shared.models import Command, CommandMode, QueueMode  # noqa: E402
+
+from .backends.mavsdk import MAVSDKBackend  # noqa: E402
+from .executor import CommandExecutor  # noqa: E402
+
 app = FastAPI(
     title="DroneSphere Agent",
     version="2.0.0",
+    default_response_class=DefaultResponse,
     description="Drone control agent for individual drone operations",
 )
 
@@ -31,12 +45,84 @@ app = FastAPI(
 AGENT_ID = 1  # TODO: Load from config file
 VERSION = "2.0.0"
 
+# Constant error responses, reused instead of rebuilt per request. Raised via
+# .with_traceback(None) so a reused instance never accumulates old tracebacks.
+_BACKEND_NOT_INITIALIZED = HTTPException(status_code=503, detail="Backend not initialized")
+_EXECUTOR_NOT_INITIALIZED = HTTPException(
+    status_code=503, detail="Command executor not initialized"
+)
+_RECONNECT_FAILED = HTTPException(
+    status_code=503, detail="Backend not connected and reconnection failed"
+)
+_POSITION_UNAVAILABLE = HTTPException(status_code=503, detail="No recent position available")
+
+# Oldest position sample /telemetry/position will serve (seconds)
+POSITION_MAX_AGE = 2.0
+
+# Encoded /telemetry body reused for this long (seconds); the collectors update at
+# stream rate, so bursts from several pollers share one snapshot and encoding
+TELEMETRY_CACHE_TTL = 0.1
+_telemetry_body: Optional[Tuple[float, bytes]] = None  # (time.monotonic(), JSON body)
+
+# /health response shape; constant fields are filled once here
+_HEALTH_TEMPLATE: Dict[str, Any] = {
+    "status": "healthy",
+    "timestamp": 0.0,
+    "agent_id": AGENT_ID,
+    "version": VERSION,
+    "uptime_seconds": 0.0,
+    "backend_connected": False,
+    "executor_ready": False,
+}
+
 # Global state
 backend = None
 executor = None
 startup_time = time.time()
 
 
+async def _reconnect_backend(drone_backend) -> None:
+    """Reconnect a disconnected backend before serving a request.
+
+    Args:
+        drone_backend: Backend to reconnect
+
+    Raises:
+        HTTPException: 503 if reconnection fails
+    """
+    print("🔄 Backend disconnected, attempting reconnection...")
+    try:
+        connection_success = await drone_backend.connect()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Backend connection failed: {str(e)}")
+
+    if not connection_success:
+        raise _RECONNECT_FAILED.with_traceback(None)
+    print("✅ Reconnection successful")
+
+
+def get_backend():
+    """FastAPI dependency returning the drone backend.
+
+    Raises:
+        HTTPException: 503 if the backend was not initialized at startup
+    """
+    if backend is None:
+        raise _BACKEND_NOT_INITIALIZED.with_traceback(None)
+    return backend
+
+
+def get_executor():
+    """FastAPI dependency returning the command executor.
+
+    Raises:
+        HTTPException: 503 if the executor was not initialized at startup
+    """
+    if executor is None:
+        raise _EXECUTOR_NOT_INITIALIZED.with_traceback(None)
+    return executor
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize agent backend and executor on startup."""
@@ -45,27 +131,15 @@ async def startup_event():
     try:
         print(f"Agent {AGENT_ID} starting up...")
 
-        # Import here to avoid circular imports
-        from .backends.mavsdk import MAVSDKBackend
-        from .executor import CommandExecutor
-
         # Initialize MAVSDK backend with auto-detection
         backend = MAVSDKBackend()  # Auto-detect connection
 
-        # Try to connect to drone (non-blocking for health checks)
-        try:
-            connection_success = await backend.connect()
-            if connection_success:
-                print("✅ MAVSDK backend connected")
-            else:
-                print("⚠️  MAVSDK connection failed - will retry on first request")
-                print("Backend created but not connected - health endpoints will show disconnected")
-        except Exception as e:
-            print(f"⚠️  MAVSDK connection failed: {e}")
-            print("Backend created but not connected - health endpoints will show disconnected")
+        # Connect (network) while command discovery (files/imports) runs in a worker thread
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(_connect_backend(backend))
+            executor_task = tg.create_task(asyncio.to_thread(CommandExecutor, backend))
 
-        # Initialize command executor
-        executor = CommandExecutor(backend)
+        executor = executor_task.result()
         print("✅ Command executor initialized")
 
     except Exception as e:
@@ -73,29 +147,45 @@ async def startup_event():
         print("Health endpoints will reflect initialization status")
 
 
+async def _connect_backend(drone_backend) -> None:
+    """Try to connect the backend at startup without failing startup.
+
+    Args:
+        drone_backend: Backend to connect
+    """
+    # Try to connect to drone (non-blocking for health checks)
+    try:
+        connection_success = await drone_backend.connect()
+        if connection_success:
+            print("✅ MAVSDK backend connected")
+        else:
+            print("⚠️  MAVSDK connection failed - will retry on first request")
+            print("Backend created but not connected - health endpoints will show disconnected")
+    except Exception as e:
+        print(f"⚠️  MAVSDK connection failed: {e}")
+        print("Backend created but not connected - health endpoints will show disconnected")
+
+
 @app.get("/health")
-async def health_check() -> Dict[str, Any]:
+def health_check() -> Dict[str, Any]:
     """Basic health check endpoint.
 
     Returns:
         Health status with timestamp and agent info
     """
     current_time = time.time()
-    uptime = current_time - startup_time
 
-    return {
-        "status": "healthy",
-        "timestamp": current_time,
-        "agent_id": AGENT_ID,
-        "version": VERSION,
-        "uptime_seconds": round(uptime, 2),
-        "backend_connected": backend.connected if backend else False,
-        "executor_ready": executor is not None,
-    }
+    # Copy the fixed-shape template (keeps key order) and fill in the live fields
+    payload = _HEALTH_TEMPLATE.copy()
+    payload["timestamp"] = current_time
+    payload["uptime_seconds"] = round(current_time - startup_time, 2)
+    payload["backend_connected"] = backend.connected if backend else False
+    payload["executor_ready"] = executor is not None
+    return payload
 
 
 @app.get("/ping")
-async def ping() -> Dict[str, float]:
+def ping() -> Dict[str, float]:
     """Simple connectivity test endpoint.
 
     Returns:
@@ -111,6 +201,8 @@ async def detailed_health() -> Dict[str, Any]:
     Returns:
         Comprehensive system status information
     """
+    now = time.time()
+
     # Get basic backend info
     backend_info = {
         "connected": backend.connected if backend else False,
@@ -131,32 +223,35 @@ async def detailed_health() -> Dict[str, Any]:
             "status": "ok",
             "version": VERSION,
             "id": AGENT_ID,
-            "uptime": round(time.time() - startup_time, 2),
+            "uptime": round(now - startup_time, 2),
         },
         "backend": backend_info,
         "executor": {
             "available": executor is not None,
-            "commands": list(executor.command_map.keys()) if executor else [],
+            "commands": executor.get_available_commands() if executor else [],
         },
         "system": {"python_version": sys.version.split()[0], "platform": sys.platform},
-        "timestamp": time.time(),
+        "timestamp": now,
     }
 
 
 # Command execution endpoint
 @app.post("/commands")
-async def execute_commands(request: dict):
+async def execute_commands(
+    request: dict,
+    command_executor=Depends(get_executor),
+    drone_backend=Depends(get_backend),
+):
     """Execute command sequence.
 
     Args:
         request: Command request dictionary
+        command_executor: Command executor (injected)
+        drone_backend: Drone backend (injected)
 
     Returns:
         Execution results
     """
-    # Import here to avoid circular imports
-    from shared.models import Command, CommandMode, CommandRequest, QueueMode
-
     try:
         # Parse request manually to handle dataclass conversion
         commands_data = request.get("commands", [])
@@ -184,80 +279,102 @@ async def execute_commands(request: dict):
         if not target_drone:
             target_drone = AGENT_ID
 
-        # Check if executor is ready
-        if not executor:
-            raise HTTPException(status_code=503, detail="Command executor not initialized")
-
         # Check backend connection before executing commands
-        if not backend or not backend.connected:
-            # Try to reconnect
-            if backend:
-                print("🔄 Backend disconnected, attempting reconnection...")
-                try:
-                    connection_success = await backend.connect()
-                    if not connection_success:
-                        raise HTTPException(
-                            status_code=503, detail="Backend not connected and reconnection failed"
-                        )
-                    print("✅ Reconnection successful")
-                except Exception as e:
-                    raise HTTPException(
-                        status_code=503, detail=f"Backend connection failed: {str(e)}"
-                    )
-            else:
-                raise HTTPException(status_code=503, detail="Backend not initialized")
+        if not drone_backend.connected:
+            await _reconnect_backend(drone_backend)
 
         # Execute commands
         print(f"🎯 Received {len(commands)} commands for drone {target_drone}")
-        results = await executor.execute_sequence(commands)
-
-        return {
-            "success": all(r.success for r in results),
-            "results": [
+        results = await command_executor.execute_sequence(commands)
+
+        # Serialize results and count successes in a single pass
+        result_dicts = []
+        successful = 0
+        for r in results:
+            successful += r.success
+            result_dicts.append(
                 {
                     "success": r.success,
                     "message": r.message,
                     "error": r.error,
                     "duration": r.duration,
                 }
-                for r in results
-            ],
+            )
+
+        return {
+            "success": successful == len(results),
+            "results": result_dicts,
             "drone_id": AGENT_ID,
             "timestamp": time.time(),
             "total_commands": len(results),
-            "successful_commands": sum(1 for r in results if r.success),
+            "successful_commands": successful,
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Command execution error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/telemetry")
-async def get_telemetry():
+async def get_telemetry(drone_backend=Depends(get_backend)):
     """Get current drone telemetry data.
 
+    Responses within TELEMETRY_CACHE_TTL of each other reuse one encoded
+    snapshot; the cache is dropped whenever the backend is disconnected.
+
+    Args:
+        drone_backend: Drone backend (injected)
+
     Returns:
         Current telemetry information
     """
-    if not backend:
-        raise HTTPException(status_code=503, detail="Backend not initialized")
+    global _telemetry_body
 
-    if not backend.connected:
+    if not drone_backend.connected:
+        _telemetry_body = None
         # Try to reconnect for telemetry requests
-        print("🔄 Backend disconnected for telemetry, attempting reconnection...")
-        try:
-            connection_success = await backend.connect()
-            if not connection_success:
-                raise HTTPException(
-                    status_code=503, detail="Backend not connected and reconnection failed"
-                )
-            print("✅ Reconnection successful for telemetry")
-        except Exception as e:
-            raise HTTPException(status_code=503, detail=f"Backend connection failed: {str(e)}")
+        await _reconnect_backend(drone_backend)
+
+    now = time.monotonic()
+    if _telemetry_body is not None and now - _telemetry_body[0] < TELEMETRY_CACHE_TTL:
+        return Response(content=_telemetry_body[1], media_type="application/json")
 
     try:
-        telemetry = await backend.get_telemetry()
-        return {"drone_id": AGENT_ID, **telemetry}
+        telemetry = drone_backend.telemetry_snapshot()
+        if telemetry is None:
+            telemetry = await drone_backend.get_telemetry()
+        response = DefaultResponse({"drone_id": AGENT_ID, **telemetry})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Telemetry error: {str(e)}")
+
+    _telemetry_body = (now, response.body)
+    return response
+
+
+@app.get("/telemetry/position")
+def get_position(drone_backend=Depends(get_backend)):
+    """Get the latest position only (lightweight endpoint for frequent polling).
+
+    Built straight from the raw float tuple kept by the backend's position
+    stream; no reconnect is attempted and no other telemetry is assembled.
+
+    Args:
+        drone_backend: Drone backend (injected)
+
+    Returns:
+        Drone ID, lat, lon, alt_amsl, alt_rel and sample timestamp
+    """
+    sample = drone_backend.get_position_raw(max_age=POSITION_MAX_AGE)
+    if sample is None:
+        raise _POSITION_UNAVAILABLE.with_traceback(None)
+    (lat, lon, alt_amsl, alt_rel), timestamp = sample
+    return {
+        "drone_id": AGENT_ID,
+        "lat": lat,
+        "lon": lon,
+        "alt_amsl": alt_amsl,
+        "alt_rel": alt_rel,
+        "timestamp": timestamp,
+    }
@@ -9,7 +9,7 @@ CHANGES:
 - Enhanced documentation for modern backends
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 class DroneBackend(ABC):
@@ -88,6 +88,39 @@ class DroneBackend(ABC):
         """
         return None
 
+    def telemetry_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Get telemetry without awaiting, if the backend keeps it in memory.
+
+        Returns:
+            Optional[dict]: Same data as get_telemetry(), or None if the
+                          backend has to fetch telemetry asynchronously.
+        """
+        return None
+
+    def get_cached_position(self, max_age: float = 0.5) -> Optional[Dict[str, float]]:
+        """Get the last known position from background telemetry.
+
+        Args:
+            max_age: Maximum sample age in seconds
+
+        Returns:
+            Optional[dict]: Position with latitude, longitude, altitude and
+                          relative_altitude, or None if no fresh sample exists.
+        """
+        return None
+
+    def get_cached_flight_state(self, max_age: float = 0.5) -> Optional[Tuple[bool, float]]:
+        """Get armed state and relative altitude from background telemetry.
+
+        Args:
+            max_age: Maximum position sample age in seconds
+
+        Returns:
+            Optional[tuple]: (armed, relative_altitude), or None if either is
+                           unknown or the position sample is stale.
+        """
+        return None
+
     async def health_check(self) -> Dict[str, Any]:
         """Perform a comprehensive health check of the backend.
 
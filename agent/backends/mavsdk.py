@@ -10,21 +10,41 @@ FIXES:
 - Environment-aware connection setup
 """
 import asyncio
+import json
 import logging
 import os
+import socket
 import subprocess
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Optional, Set, Tuple
 
 from mavsdk import System
 
 logger = logging.getLogger(__name__)
 
+# Reported as px4_origin until the first GPS fix (PX4 SITL default home, Zurich).
+# Shared by every snapshot, so treat it as read-only.
+DEFAULT_PX4_ORIGIN: Dict[str, float] = {
+    "latitude": 47.3977505,
+    "longitude": 8.5456072,
+    "altitude": 488.0,
+}
 
-@dataclass
+# GpsInfo fields (defaulted when a MAVSDK version lacks them) and precision fields
+# only present in some versions
+GPS_FIELDS = ("num_satellites", "fix_type")
+GPS_OPTIONAL_ATTRS = ("hdop", "vdop", "horizontal_accuracy_m", "vertical_accuracy_m")
+
+
+@dataclass(slots=True)
 class TelemetryState:
-    """Thread-safe telemetry state container."""
+    """Thread-safe telemetry state container.
+
+    Slotted to avoid a per-instance __dict__; a fresh instance is created on
+    every disconnect, and collectors stop once the instance they started with
+    has been replaced.
+    """
 
     position: Optional[Dict[str, float]] = None
     attitude: Optional[Dict[str, float]] = None
@@ -37,7 +57,11 @@ class TelemetryState:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict, filtering None values."""
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {
+            name: value
+            for name in self.__slots__
+            if (value := getattr(self, name)) is not None
+        }
 
 
 class MAVSDKBackend:
@@ -46,6 +70,7 @@ class MAVSDKBackend:
     # Default connection parameters
     DEFAULT_CONNECTION_TIMEOUT = 30.0
     DEFAULT_CHECK_INTERVAL = 0.5
+    DEFAULT_DISCONNECT_TIMEOUT = 2.0
 
     # GPS fix type mapping for different MAVSDK versions
     GPS_FIX_TYPES = {
@@ -76,6 +101,11 @@ class MAVSDKBackend:
         self._telemetry_state = TelemetryState()
         self._px4_origin: Optional[Dict[str, float]] = None
         self._origin_set = False
+        self._position_timestamp = 0.0  # time.monotonic() of last position sample
+        # (lat, lon, alt_amsl, alt_rel) of last sample plus its wall-clock time
+        self._position_raw: Optional[Tuple[float, float, float, float]] = None
+        self._position_wall_time = 0.0
+        self._position_event = asyncio.Event()  # set on every streamed position sample
 
         logger.info(f"🔧 MAVSDK Backend initialized with connection: {self._connection_string}")
 
@@ -114,8 +144,6 @@ class MAVSDKBackend:
                 timeout=5,
             )
             if result.returncode == 0:
-                import json
-
                 network_info = json.loads(result.stdout)
                 if network_info and len(network_info) > 0:
                     gateway = network_info[0].get("IPAM", {}).get("Config", [{}])[0].get("Gateway")
@@ -151,8 +179,6 @@ class MAVSDKBackend:
 
     def _check_port_availability(self, port: int) -> bool:
         """Check if a port is available for binding."""
-        import socket
-
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
                 sock.bind(('', port))
@@ -183,6 +209,10 @@ class MAVSDKBackend:
         if docker_ip and f"udpin://{docker_ip}:14540" not in connection_attempts:
             connection_attempts.insert(-2, f"udpin://{docker_ip}:14540")
 
+        # A previously successful fallback becomes the primary string on reconnect;
+        # drop its later duplicate so a dead link is not probed twice
+        connection_attempts = list(dict.fromkeys(connection_attempts))
+
         for attempt, conn in enumerate(connection_attempts, 1):
             logger.info(f"🔄 Attempt {attempt}/{len(connection_attempts)}: Connecting to {conn}")
 
@@ -191,8 +221,9 @@ class MAVSDKBackend:
 
                 # Connect with timeout
                 try:
-                    await asyncio.wait_for(self.drone.connect(system_address=conn), timeout=8.0)
-                except asyncio.TimeoutError:
+                    async with asyncio.timeout(8.0):
+                        await self.drone.connect(system_address=conn)
+                except TimeoutError:
                     logger.warning(f"⏱️  Connection {attempt} timed out after 8s")
                     continue
 
@@ -262,13 +293,22 @@ class MAVSDKBackend:
 
     async def _collect_position(self) -> None:
         """Collect position data with error handling and PX4 origin tracking."""
+        state = self._telemetry_state
         async for position in self.drone.telemetry.position():
+            if state is not self._telemetry_state:
+                break  # Stale collector from an earlier connection
             try:
+                raw = (
+                    float(position.latitude_deg),
+                    float(position.longitude_deg),
+                    float(position.absolute_altitude_m),
+                    float(position.relative_altitude_m),
+                )
                 position_data = {
-                    "latitude": float(position.latitude_deg),
-                    "longitude": float(position.longitude_deg),
-                    "altitude": float(position.absolute_altitude_m),
-                    "relative_altitude": float(position.relative_altitude_m),
+                    "latitude": raw[0],
+                    "longitude": raw[1],
+                    "altitude": raw[2],
+                    "relative_altitude": raw[3],
                 }
 
                 # Track PX4 origin (first valid GPS position)
@@ -285,16 +325,23 @@ class MAVSDKBackend:
                     self._origin_set = True
                     logger.info(f"📍 PX4 origin set: {self._px4_origin}")
 
-                self._telemetry_state.position = position_data
+                state.position = position_data
+                self._position_raw = raw
+                self._position_wall_time = time.time()
+                self._position_timestamp = time.monotonic()
+                self._position_event.set()
 
             except Exception as e:
                 logger.error(f"Error processing position data: {e}")
 
     async def _collect_attitude(self) -> None:
         """Collect attitude data with error handling."""
+        state = self._telemetry_state
         async for attitude in self.drone.telemetry.attitude_euler():
+            if state is not self._telemetry_state:
+                break  # Stale collector from an earlier connection
             try:
-                self._telemetry_state.attitude = {
+                state.attitude = {
                     "roll": float(attitude.roll_deg),
                     "pitch": float(attitude.pitch_deg),
                     "yaw": float(attitude.yaw_deg),
@@ -304,9 +351,12 @@ class MAVSDKBackend:
 
     async def _collect_battery(self) -> None:
         """Collect battery data with error handling."""
+        state = self._telemetry_state
         async for battery in self.drone.telemetry.battery():
+            if state is not self._telemetry_state:
+                break  # Stale collector from an earlier connection
             try:
-                self._telemetry_state.battery = {
+                state.battery = {
                     "voltage": float(battery.voltage_v),
                     "remaining": float(battery.remaining_percent),
                 }
@@ -314,39 +364,68 @@ class MAVSDKBackend:
                 logger.error(f"Error processing battery data: {e}")
 
     async def _collect_flight_mode(self) -> None:
-        """Collect flight mode data with error handling."""
+        """Collect flight mode data with error handling.
+
+        The mode repeats on every update, so it is only converted when it changes.
+        """
+        last_mode = None
+        state = self._telemetry_state
         async for flight_mode in self.drone.telemetry.flight_mode():
+            if state is not self._telemetry_state:
+                break  # Stale collector from an earlier connection
+            if flight_mode is last_mode and state.flight_mode is not None:
+                continue
             try:
-                self._telemetry_state.flight_mode = str(flight_mode)
+                state.flight_mode = str(flight_mode)
+                last_mode = flight_mode
             except Exception as e:
                 logger.error(f"Error processing flight mode data: {e}")
 
     async def _collect_gps_info(self) -> None:
         """Collect GPS information with robust attribute handling."""
+        # Which fields this MAVSDK version provides is resolved once from the first
+        # sample rather than probed every tick
+        fields: Optional[Tuple[str, ...]] = None
+        last_values = None
+        state = self._telemetry_state
         async for gps_info in self.drone.telemetry.gps_info():
+            if state is not self._telemetry_state:
+                break  # Stale collector from an earlier connection
             try:
+                if fields is None:
+                    fields = tuple(
+                        attr_name
+                        for attr_name in GPS_FIELDS + GPS_OPTIONAL_ATTRS
+                        if hasattr(gps_info, attr_name)
+                    )
+
+                values = tuple(getattr(gps_info, attr_name) for attr_name in fields)
+                if values == last_values:
+                    continue
+                last_values = values
+
+                sample = dict(zip(fields, values))
                 gps_data = {
-                    "num_satellites": getattr(gps_info, 'num_satellites', 0),
-                    "fix_type": self._get_fix_type_string(getattr(gps_info, 'fix_type', 0)),
+                    "num_satellites": sample.pop("num_satellites", 0),
+                    "fix_type": self._get_fix_type_string(sample.pop("fix_type", 0)),
                 }
+                for attr_name, value in sample.items():
+                    if value is not None:
+                        gps_data[attr_name] = value
 
-                # Optional precision attributes (may not exist in all versions)
-                for attr_name in ['hdop', 'vdop', 'horizontal_accuracy_m', 'vertical_accuracy_m']:
-                    if hasattr(gps_info, attr_name):
-                        value = getattr(gps_info, attr_name)
-                        if value is not None:
-                            gps_data[attr_name] = value
-
-                self._telemetry_state.gps_info = gps_data
+                state.gps_info = gps_data
 
             except Exception as e:
                 logger.error(f"Error processing GPS info data: {e}")
 
     async def _collect_armed_state(self) -> None:
         """Collect armed state with error handling."""
+        state = self._telemetry_state
         async for armed in self.drone.telemetry.armed():
+            if state is not self._telemetry_state:
+                break  # Stale collector from an earlier connection
             try:
-                self._telemetry_state.armed = bool(armed)
+                state.armed = bool(armed)
             except Exception as e:
                 logger.error(f"Error processing armed state data: {e}")
 
@@ -368,6 +447,20 @@ class MAVSDKBackend:
     async def get_telemetry(self) -> Dict[str, Any]:
         """Get current telemetry data with connection status.
 
+        Kept for the DroneBackend interface; prefer telemetry_snapshot() on
+        hot paths since no I/O is involved.
+
+        Returns:
+            dict: Current telemetry including all available data
+        """
+        return self.telemetry_snapshot()
+
+    def telemetry_snapshot(self) -> Dict[str, Any]:
+        """Read telemetry maintained by the background collectors.
+
+        Synchronous: the collectors keep the state current, so callers can read
+        it without awaiting.
+
         Returns:
             dict: Current telemetry including all available data
         """
@@ -378,19 +471,81 @@ class MAVSDKBackend:
         # Get base telemetry
         telemetry = self._telemetry_state.to_dict()
 
-        # Add PX4 origin
-        if self._px4_origin:
-            telemetry["px4_origin"] = self._px4_origin.copy()
-        else:
-            # Provide default origin if not yet set
-            telemetry["px4_origin"] = {
-                "latitude": 47.3977505,  # Zurich default
-                "longitude": 8.5456072,
-                "altitude": 488.0,
-            }
+        # Add PX4 origin; the origin dict is replaced, never mutated, so it is shared
+        telemetry["px4_origin"] = self._px4_origin or DEFAULT_PX4_ORIGIN
 
         return telemetry
 
+    def get_cached_position(self, max_age: float = 0.5) -> Optional[Dict[str, float]]:
+        """Get the last streamed position if it is recent enough.
+
+        Reads the sample maintained by the background position collector,
+        avoiding a fresh MAVSDK subscription round-trip.
+
+        Args:
+            max_age: Maximum sample age in seconds
+
+        Returns:
+            Optional[dict]: Cached position data or None if stale/unavailable
+        """
+        position = self._telemetry_state.position
+        if position is None or time.monotonic() - self._position_timestamp > max_age:
+            return None
+        return position
+
+    async def wait_for_position(self, timeout: float) -> Optional[Dict[str, float]]:
+        """Wait for the next streamed position sample.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Optional[dict]: New position data or None if none arrived in time
+        """
+        event = self._position_event
+        event.clear()
+        try:
+            async with asyncio.timeout(timeout):
+                await event.wait()
+        except TimeoutError:
+            return None
+        return self._telemetry_state.position
+
+    def get_cached_flight_state(self, max_age: float = 0.5) -> Optional[Tuple[bool, float]]:
+        """Get armed state and relative altitude from the streamed telemetry.
+
+        Lets commands check preconditions without opening one-shot MAVSDK
+        subscriptions for every command in a sequence.
+
+        Args:
+            max_age: Maximum position sample age in seconds
+
+        Returns:
+            Optional[tuple]: (armed, relative_altitude) or None if stale/unavailable
+        """
+        armed = self._telemetry_state.armed
+        position = self.get_cached_position(max_age)
+        if armed is None or position is None:
+            return None
+        return armed, position["relative_altitude"]
+
+    def get_position_raw(
+        self, max_age: float = 0.5
+    ) -> Optional[Tuple[Tuple[float, float, float, float], float]]:
+        """Get the last streamed position as raw floats if it is recent enough.
+
+        Args:
+            max_age: Maximum sample age in seconds
+
+        Returns:
+            Optional[tuple]: ((lat, lon, alt_amsl, alt_rel), sample wall-clock time)
+            or None if stale/unavailable
+        """
+        raw = self._position_raw
+        if raw is None or time.monotonic() - self._position_timestamp > max_age:
+            return None
+        return raw, self._position_wall_time
+
     async def get_px4_origin(self) -> Optional[Dict[str, float]]:
         """Get PX4 origin (first GPS fix position).
 
@@ -412,17 +567,29 @@ class MAVSDKBackend:
                 if not task.done():
                     task.cancel()
 
-            # Wait for tasks to complete cancellation
+            # Wait for tasks to complete cancellation, but never hang on a stuck stream.
+            # asyncio.wait returns at the timeout even if a task ignores cancellation
+            # (a cancelled gather would keep waiting for it)
             if self._telemetry_tasks:
-                await asyncio.gather(*self._telemetry_tasks, return_exceptions=True)
-
-            self._telemetry_tasks.clear()
+                _, pending = await asyncio.wait(
+                    self._telemetry_tasks, timeout=self.DEFAULT_DISCONNECT_TIMEOUT
+                )
+                if pending:
+                    # Stragglers stay in _telemetry_tasks (and are cancelled again on the
+                    # next disconnect); their collectors exit on the next sample because
+                    # the state below is replaced
+                    logger.warning(
+                        f"⚠️ {len(pending)} telemetry tasks did not stop within "
+                        f"{self.DEFAULT_DISCONNECT_TIMEOUT}s, leaving them cancelled"
+                    )
 
         # Reset state
         self.connected = False
         self._telemetry_state = TelemetryState()
         self._px4_origin = None
         self._origin_set = False
+        self._position_timestamp = 0.0
+        self._position_raw = None
         self._shutdown_event.clear()
 
         logger.info("🔌 Disconnected from drone")
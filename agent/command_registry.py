@@ -3,18 +3,222 @@
 Path: agent/command_registry.py
 Handles relative imports correctly.
 """
+import functools
 import importlib
 import inspect
 import logging
+import math
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Type
 
 import yaml
 from jsonschema import Draft7Validator
 
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Keywords the compiled fast path understands; anything else uses jsonschema only
+_FAST_SCHEMA_KEYWORDS = frozenset({"type", "properties", "required", "oneOf", "description"})
+_FAST_PROPERTY_KEYWORDS = frozenset(
+    {"type", "minimum", "maximum", "minLength", "maxLength", "default", "description"}
+)
+_FAST_TYPES = {"number": (int, float), "integer": (int,), "string": (str,)}
+
+ParamCheck = Callable[[Dict[str, Any]], List[str]]
+
+# Command modules whose class name doesn't follow the <Name>Command convention
+_SPECIAL_CLASS_NAMES = {
+    "rtl": "RTLCommand",
+    "goto": "GotoCommand",
+}
+
+
+def _compile_fast_check(schema: Dict[str, Any]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """Compile a simple object schema into a closure answering "is this valid?".
+
+    Bounds are extracted once (with -inf/inf sentinels for missing limits) so
+    the per-call work is a flat loop with no schema lookups. The check is
+    conservative: ``False`` only means "let jsonschema decide".
+
+    Args:
+        schema: JSON schema from a command's ``validation_schema``
+
+    Returns:
+        Check function, or None if the schema uses unsupported keywords
+    """
+    if schema.get("type") != "object" or set(schema) - _FAST_SCHEMA_KEYWORDS:
+        return None
+
+    properties = []
+    for name, spec in schema.get("properties", {}).items():
+        types = _FAST_TYPES.get(spec.get("type"))
+        if types is None or set(spec) - _FAST_PROPERTY_KEYWORDS:
+            return None
+        if types[0] is str:
+            low, high = spec.get("minLength", 0), spec.get("maxLength", math.inf)
+        else:
+            low, high = spec.get("minimum", -math.inf), spec.get("maximum", math.inf)
+        properties.append((name, types, low, high))
+
+    required = tuple(schema.get("required", ()))
+    one_of = []
+    for branch in schema.get("oneOf", ()):
+        if set(branch) != {"required"}:
+            return None
+        one_of.append(tuple(branch["required"]))
+
+    def check(params: Dict[str, Any]) -> bool:
+        if not isinstance(params, dict):
+            return False
+        for key in required:
+            if key not in params:
+                return False
+        for name, types, low, high in properties:
+            if name in params:
+                value = params[name]
+                # bool is an int subclass but not a JSON number
+                if isinstance(value, bool) or not isinstance(value, types):
+                    return False
+                if not low <= (len(value) if types[0] is str else value) <= high:
+                    return False
+        if one_of and sum(all(k in params for k in keys) for keys in one_of) != 1:
+            return False
+        return True
+
+    return check
+
+
+def _compile_validator(validator: Draft7Validator) -> ParamCheck:
+    """Build the parameter check used by ``validate_params``.
+
+    Parameters the schema does not declare are rejected up front. Valid
+    parameters are accepted by the compiled fast path when the schema allows
+    it; other error messages come from jsonschema.
+
+    Args:
+        validator: jsonschema validator for the command
+
+    Returns:
+        Function returning a list of error messages (empty if valid)
+    """
+    iter_errors = validator.iter_errors
+    schema = validator.schema
+    # Parameters not declared in the schema are rejected before any schema walk
+    allowed = frozenset(schema["properties"]) if "properties" in schema else None
+
+    def collect_errors(params: Dict[str, Any]) -> List[str]:
+        return [
+            f"{'.'.join(str(p) for p in error.path) if error.path else 'root'}: {error.message}"
+            for error in iter_errors(params)
+        ]
+
+    fast_check = _compile_fast_check(schema)
+
+    def check(params: Dict[str, Any]) -> List[str]:
+        if allowed is not None and isinstance(params, dict):
+            extras = params.keys() - allowed
+            if extras:
+                return [f"root: Unknown parameter(s): {', '.join(sorted(map(str, extras)))}"]
+        if fast_check is not None and fast_check(params):
+            return []
+        return collect_errors(params)
+
+    return check
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_import(module_path: str):
+    """Import a module, returning the ``sys.modules`` entry when already loaded.
+
+    Args:
+        module_path: Dotted module path
+
+    Returns:
+        The imported module
+    """
+    return sys.modules.get(module_path) or importlib.import_module(module_path)
+
+
+# Packages command modules may live under, depending on how the agent was started
+_COMMAND_PACKAGES = ("commands", "agent.commands")
+
+# Package that resolved the last command module; tried first on later imports
+_command_package: Optional[str] = None
+
+
+def _import_command_module(command_name: str):
+    """Import a command module, probing the candidate packages only until one works.
+
+    Args:
+        command_name: Name of the command (module name under the package)
+
+    Returns:
+        The imported module
+
+    Raises:
+        ImportError: If the module cannot be imported from any package
+    """
+    global _command_package
+    packages = _COMMAND_PACKAGES
+    if _command_package is not None:
+        packages = (_command_package,) + tuple(p for p in packages if p != _command_package)
+
+    errors = []
+    for package in packages:
+        try:
+            module = _cached_import(f"{package}.{command_name}")
+        except ImportError as e:
+            errors.append(str(e))
+            continue
+        _command_package = package
+        return module
+
+    raise ImportError(" / ".join(errors))
+
+
+def _parse_schema_file(path: Path) -> Dict[str, Any]:
+    """Parse a schema file.
+
+    Args:
+        path: Schema file to load
+
+    Returns:
+        Parsed YAML schema document
+    """
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+def _find_yaml(root: Path) -> Iterator[Path]:
+    """Yield YAML files under root, skipping hidden directories.
+
+    Uses ``os.scandir`` so directory checks come from the cached ``DirEntry``
+    type instead of an extra ``stat`` per entry.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Paths of ``.yaml``/``.yml`` files
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(Path(entry.path))
+                elif entry.name.endswith(('.yaml', '.yml')):
+                    yield Path(entry.path)
+
 
 class CommandRegistry:
     """Dynamic command discovery and registration system."""
@@ -40,6 +244,9 @@ class CommandRegistry:
         self.commands: Dict[str, Type] = {}
         self.schemas: Dict[str, Dict[str, Any]] = {}
         self.validators: Dict[str, Draft7Validator] = {}
+        self._param_checks: Dict[str, ParamCheck] = {}
+        self.categories: Dict[str, Set[str]] = {}
+        self._command_names: Optional[List[str]] = None
 
         # Ensure paths are in sys.path for imports to work
         if str(project_root) not in sys.path:
@@ -52,9 +259,20 @@ class CommandRegistry:
         logger.info(f"  Schemas dir: {self.schemas_dir}")
 
     def discover_and_register(self) -> None:
-        """Auto-discover and register all commands."""
+        """Auto-discover and register all commands.
+
+        Safe to call again for a reload: previously registered entries are
+        cleared first so nothing is duplicated or left stale.
+        """
         logger.info(f"🔍 Starting command discovery...")
 
+        self.commands.clear()
+        self.schemas.clear()
+        self.validators.clear()
+        self._param_checks.clear()
+        self.categories.clear()
+        self._command_names = None
+
         # Discover Python command files using module imports (not file loading)
         if self.commands_dir.exists():
             command_files = [
@@ -73,32 +291,39 @@ class CommandRegistry:
 
         # Discover YAML schemas
         if self.schemas_dir.exists():
-            schema_files = [
-                f for f in self.schemas_dir.glob("*.yaml") if f.stem != "fleet_discovery"
-            ]
-            logger.info(f"📁 Found {len(schema_files)} schema files")
-
-            for schema_file in schema_files:
+            schema_count = 0
+            for schema_file in _find_yaml(self.schemas_dir):
+                if schema_file.stem == "fleet_discovery":
+                    continue
+                schema_count += 1
                 try:
-                    with open(schema_file, 'r') as f:
-                        schema_data = yaml.safe_load(f)
-
-                    if command_name := schema_data.get('name'):
-                        self.schemas[command_name] = schema_data
-
-                        if 'validation_schema' in schema_data:
-                            self.validators[command_name] = Draft7Validator(
-                                schema_data['validation_schema']
-                            )
-                        logger.info(f"📋 Loaded schema: {command_name}")
-
+                    self._register_schema(_parse_schema_file(schema_file))
                 except Exception as e:
                     logger.error(f"Failed to load schema {schema_file}: {e}")
+
+            logger.info(f"📁 Found {schema_count} schema files")
         else:
             logger.warning(f"Schemas directory not found: {self.schemas_dir}")
 
         logger.info(f"🚀 Registry ready: {len(self.commands)} commands, {len(self.schemas)} schemas")
 
+    def _register_schema(self, schema_data: Dict[str, Any]) -> None:
+        """Register a parsed schema and build its validator.
+
+        Args:
+            schema_data: Parsed YAML schema document
+        """
+        if command_name := schema_data.get('name'):
+            self.schemas[command_name] = schema_data
+            category = schema_data.get("category", "uncategorized")
+            self.categories.setdefault(category, set()).add(command_name)
+
+            if 'validation_schema' in schema_data:
+                validator = Draft7Validator(schema_data['validation_schema'])
+                self.validators[command_name] = validator
+                self._param_checks[command_name] = _compile_validator(validator)
+            logger.info(f"📋 Loaded schema: {command_name}")
+
     def _load_command_module(self, command_name: str) -> bool:
         """Load command class using proper module import.
 
@@ -109,42 +334,23 @@ class CommandRegistry:
             True if class was loaded successfully
         """
         try:
-            # Use standard module import which handles relative imports correctly
-            module_path = f"commands.{command_name}"
-
-            # Import the module (this will handle relative imports properly)
-            module = importlib.import_module(module_path)
-
-            # Find the command class
-            class_name = self._find_command_class(module, command_name)
-            if class_name:
-                command_class = getattr(module, class_name)
-                self.commands[command_name] = command_class
-                return True
-            else:
-                logger.warning(f"No command class found in {module_path}")
-                return False
-
+            module = _import_command_module(command_name)
         except ImportError as e:
-            # Try with agent prefix
-            try:
-                module_path = f"agent.commands.{command_name}"
-                module = importlib.import_module(module_path)
-
-                class_name = self._find_command_class(module, command_name)
-                if class_name:
-                    command_class = getattr(module, class_name)
-                    self.commands[command_name] = command_class
-                    return True
-
-            except ImportError as e2:
-                logger.error(f"Cannot import {command_name}: {e} / {e2}")
-                return False
-
+            logger.error(f"Cannot import {command_name}: {e}")
+            return False
         except Exception as e:
             logger.error(f"Error loading {command_name}: {e}")
             return False
 
+        # Find the command class
+        class_name = self._find_command_class(module, command_name)
+        if class_name:
+            self.commands[command_name] = getattr(module, class_name)
+            return True
+
+        logger.warning(f"No command class found in {module.__name__}")
+        return False
+
     def _find_command_class(self, module, command_name: str) -> Optional[str]:
         """Find command class in module using various naming conventions.
 
@@ -155,16 +361,10 @@ class CommandRegistry:
         Returns:
             Name of the found class or None
         """
-        # Special cases mapping
-        special_cases = {
-            "rtl": "RTLCommand",
-            "goto": "GotoCommand",
-        }
-
         # Try different naming conventions
         possible_names = [
             # Special cases first
-            special_cases.get(command_name.lower()),
+            _SPECIAL_CLASS_NAMES.get(command_name.lower()),
             # Standard convention: capitalize first letter
             f"{command_name.capitalize()}Command",
             # All caps
@@ -205,19 +405,14 @@ class CommandRegistry:
         Returns:
             List of validation error messages (empty if valid)
         """
-        if command_name not in self.validators:
+        check = self._param_checks.get(command_name)
+        if check is None:
             return []  # No validation schema defined
 
-        errors = []
         try:
-            validator = self.validators[command_name]
-            for error in validator.iter_errors(params):
-                path = '.'.join(str(p) for p in error.path) if error.path else 'root'
-                errors.append(f"{path}: {error.message}")
+            return check(params)
         except Exception as e:
-            errors.append(f"Validation error: {str(e)}")
-
-        return errors
+            return [f"Validation error: {str(e)}"]
 
     def get_command_class(self, command_name: str) -> Optional[Type]:
         """Get command class by name."""
@@ -228,8 +423,17 @@ class CommandRegistry:
         return self.schemas.get(command_name)
 
     def list_commands(self) -> List[str]:
-        """Get list of all registered command names."""
-        return list(self.commands.keys())
+        """Get list of all registered command names (shared list, do not modify).
+
+        Built once per discovery; the command set does not change in between.
+        """
+        if self._command_names is None:
+            self._command_names = list(self.commands.keys())
+        return self._command_names
+
+    def list_categories(self) -> Dict[str, List[str]]:
+        """Get command names grouped by schema category."""
+        return {category: sorted(names) for category, names in self.categories.items()}
 
     def get_command_info(self) -> List[Dict[str, Any]]:
         """Get information about all registered commands."""
@@ -273,3 +477,17 @@ class CommandRegistry:
             )
 
         return params
+
+
+# Global command registry instance
+_command_registry: Optional[CommandRegistry] = None
+
+
+def get_command_registry() -> CommandRegistry:
+    """Get the global command registry, discovering commands on first use."""
+    global _command_registry
+    if _command_registry is None:
+        registry = CommandRegistry()
+        registry.discover_and_register()
+        _command_registry = registry
+    return _command_registry
@@ -5,7 +5,7 @@ Path: agent/commands/base.py
 import os
 import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 # Add parent directory to path for shared imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -14,7 +14,14 @@ from shared.models import CommandResult
 
 
 class BaseCommand(ABC):
-    """Abstract base class for all drone commands."""
+    """Abstract base class for all drone commands.
+
+    Attributes:
+        timeout: Deadline in seconds the executor applies to execute(), or
+                 None for commands bounded by their own parameters
+    """
+
+    timeout: Optional[float] = 60.0
 
     def __init__(self, name: str, params: Dict[str, Any]):
         """Initialize command with name and parameters.
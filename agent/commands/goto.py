@@ -12,7 +12,7 @@ USAGE:
 
 ROBUSTNESS: Only operates when drone is armed and airborne.
 """
-import asyncio
+import logging
 import math
 import time
 from typing import Any, Dict, Optional, Tuple
@@ -21,6 +21,11 @@ from shared.models import CommandResult
 
 from .base import BaseCommand
 
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_M = 6371000.0
+DEG_TO_RAD = math.pi / 180.0
+
 try:
     import pymap3d as pm
 except ImportError:
@@ -48,6 +53,8 @@ class GotoCommand(BaseCommand):
     Robustness: Requires drone to be armed and airborne.
     """
 
+    timeout = 75.0  # 60s arrival monitor plus setup
+
     def validate_params(self) -> None:
         """Validate command parameters for GPS or NED coordinates."""
         params = self.params
@@ -120,19 +127,25 @@ class GotoCommand(BaseCommand):
         Raises:
             RuntimeError: If drone is not armed or not airborne
         """
-        drone = backend.drone
+        # Prefer the backend's streamed state; fall back to one-shot subscriptions
+        cached = backend.get_cached_flight_state()
+        if cached is not None:
+            is_armed, relative_altitude = cached
+        else:
+            drone = backend.drone
+            async for is_armed in drone.telemetry.armed():
+                break
+            async for position in drone.telemetry.position():
+                relative_altitude = position.relative_altitude_m
+                break
 
         # Check if armed
-        async for is_armed in drone.telemetry.armed():
-            if not is_armed:
-                raise RuntimeError("goto command requires drone to be armed. Use takeoff first.")
-            break
+        if not is_armed:
+            raise RuntimeError("goto command requires drone to be armed. Use takeoff first.")
 
         # Check if airborne (relative altitude > 0.5m)
-        async for position in drone.telemetry.position():
-            if position.relative_altitude_m < 0.5:
-                raise RuntimeError("goto command requires drone to be airborne. Use takeoff first.")
-            break
+        if relative_altitude < 0.5:
+            raise RuntimeError("goto command requires drone to be airborne. Use takeoff first.")
 
     async def _get_px4_origin_dynamic(self, backend) -> Tuple[float, float, float]:
         """Get PX4 origin GPS coordinates dynamically from telemetry.
@@ -235,42 +248,37 @@ class GotoCommand(BaseCommand):
 
             print(f"🚁 Navigate command sent, monitoring arrival...")
 
-            # Monitor arrival with timeout
+            # Monitor arrival with timeout, woken by each streamed position sample
             timeout = 60.0
-            check_interval = 0.5
-            elapsed = 0.0
-
-            while elapsed < timeout:
-                async for position in drone.telemetry.position():
-                    current_lat = position.latitude_deg
-                    current_lon = position.longitude_deg
-                    current_alt = position.absolute_altitude_m
-
-                    # Calculate 3D distance to target
-                    distance = self._calculate_distance(
-                        current_lat,
-                        current_lon,
-                        current_alt,
-                        target_lat,
-                        target_lon,
-                        target_alt_msl,
-                    )
-
-                    if distance <= acceptance_radius:
-                        duration = time.time() - start_time
-                        return CommandResult(
-                            success=True,
-                            message=f"goto to {coord_type} coordinates completed successfully (distance: {distance:.1f}m)",
-                            duration=duration,
-                        )
-
-                    # Log progress every 5 seconds
-                    if elapsed % 5.0 < check_interval:
-                        print(f"   📊 Distance to target: {distance:.1f}m")
+            progress_interval = 5.0
+            next_progress_log = 0.0
+            debug_progress = logger.isEnabledFor(logging.DEBUG)  # checked once per command
+            deadline = time.monotonic() + timeout
+            target = self._prepare_target(target_lat, target_lon, target_alt_msl)
+
+            while (remaining := deadline - time.monotonic()) > 0:
+                position = await backend.wait_for_position(remaining)
+                if position is None:
                     break
 
-                await asyncio.sleep(check_interval)
-                elapsed += check_interval
+                # Calculate 3D distance to target
+                distance = self._distance_to_target(
+                    position["latitude"], position["longitude"], position["altitude"], target
+                )
+
+                if distance <= acceptance_radius:
+                    duration = time.time() - start_time
+                    return CommandResult(
+                        success=True,
+                        message=f"goto to {coord_type} coordinates completed successfully (distance: {distance:.1f}m)",
+                        duration=duration,
+                    )
+
+                # Log progress every 5 seconds
+                elapsed = timeout - remaining
+                if debug_progress and elapsed >= next_progress_log:
+                    logger.debug("goto progress: %.1fm to target", distance)
+                    next_progress_log += progress_interval
 
             # Timeout reached
             duration = time.time() - start_time
@@ -287,35 +295,44 @@ class GotoCommand(BaseCommand):
                 success=False, message=f"goto failed: {str(e)}", error=str(e), duration=duration
             )
 
-    def _calculate_distance(
-        self, lat1: float, lon1: float, alt1: float, lat2: float, lon2: float, alt2: float
+    @staticmethod
+    def _prepare_target(lat: float, lon: float, alt: float) -> Tuple[float, float, float, float]:
+        """Precompute the per-target terms of the distance calculation.
+
+        Args:
+            lat: Target latitude in degrees
+            lon: Target longitude in degrees
+            alt: Target altitude in meters
+
+        Returns:
+            tuple: (lat_rad, lon_rad, cos(lat), alt) for _distance_to_target
+        """
+        lat_rad = lat * DEG_TO_RAD
+        return lat_rad, lon * DEG_TO_RAD, math.cos(lat_rad), alt
+
+    @staticmethod
+    def _distance_to_target(
+        lat: float, lon: float, alt: float, target: Tuple[float, float, float, float]
     ) -> float:
-        """Calculate 3D distance between two GPS coordinates.
+        """Calculate 3D distance from a GPS coordinate to a prepared target.
+
+        Args:
+            lat: Current latitude in degrees
+            lon: Current longitude in degrees
+            alt: Current altitude in meters
+            target: Result of _prepare_target
 
         Returns:
             float: Distance in meters
         """
-        # Convert to radians
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
+        target_lat_rad, target_lon_rad, cos_target_lat, target_alt = target
+        lat_rad = lat * DEG_TO_RAD
 
         # Haversine formula for horizontal distance
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
-        )
-        c = 2 * math.asin(math.sqrt(a))
-
-        # Earth radius in meters
-        earth_radius = 6371000
-        horizontal_distance = earth_radius * c
-
-        # Vertical distance
-        vertical_distance = abs(alt2 - alt1)
+        dlat = target_lat_rad - lat_rad
+        dlon = target_lon_rad - lon * DEG_TO_RAD
+        a = math.sin(dlat / 2) ** 2 + math.cos(lat_rad) * cos_target_lat * math.sin(dlon / 2) ** 2
+        horizontal_distance = EARTH_RADIUS_M * 2 * math.asin(math.sqrt(a))
 
-        # 3D distance
-        return math.sqrt(horizontal_distance**2 + vertical_distance**2)
+        # 3D distance with the vertical offset
+        return math.hypot(horizontal_distance, alt - target_alt)
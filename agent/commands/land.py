@@ -20,6 +20,10 @@ class LandCommand(BaseCommand):
     If already on ground, returns informational message without action.
     """
 
+    # Descent from max altitude (50m) at PX4's default land speed fits well inside this
+    LAND_TIMEOUT = 90.0
+    timeout = LAND_TIMEOUT + 10.0
+
     def validate_params(self) -> None:
         """Validate land parameters (none required)."""
         # Land command takes no parameters
@@ -28,17 +32,23 @@ class LandCommand(BaseCommand):
     async def _check_airborne_state(self, backend) -> bool:
         """Check if drone is airborne.
 
+        Uses the backend's cached position when fresh, falling back to a
+        telemetry subscription otherwise.
+
         Returns:
             bool: True if airborne (relative altitude > 0.5m), False if on ground
         """
-        drone = backend.drone
+        position = backend.get_cached_position(max_age=0.5)
 
-        async for position in drone.telemetry.position():
-            relative_alt = position.relative_altitude_m
-            is_airborne = relative_alt > 0.5
+        if position is not None:
+            relative_alt = position["relative_altitude"]
+        else:
+            async for position in backend.drone.telemetry.position():
+                relative_alt = position.relative_altitude_m
+                break
 
-            print(f"📊 Current relative altitude: {relative_alt:.2f}m")
-            return is_airborne
+        print(f"📊 Current relative altitude: {relative_alt:.2f}m")
+        return relative_alt > 0.5
 
     async def execute(self, backend) -> CommandResult:
         """Execute land using MAVSDK backend."""
@@ -72,8 +82,20 @@ class LandCommand(BaseCommand):
             # Execute landing
             await drone.action.land()
 
-            # Wait for landing completion
-            await asyncio.sleep(10)
+            # Wait for the autopilot to report touchdown (pushed in-air stream, no polling)
+            try:
+                async with asyncio.timeout(self.LAND_TIMEOUT):
+                    async for in_air in drone.telemetry.in_air():
+                        if not in_air:
+                            break
+            except TimeoutError:
+                duration = time.time() - start_time
+                return CommandResult(
+                    success=False,
+                    message=f"Landing not confirmed within {self.LAND_TIMEOUT:.0f}s",
+                    error="timeout",
+                    duration=duration,
+                )
 
             duration = time.time() - start_time
 
@@ -21,6 +21,14 @@ class TakeoffCommand(BaseCommand):
     If already airborne, returns informational message without action.
     """
 
+    # Climb is complete once within this fraction of the target altitude
+    ALTITUDE_REACHED_RATIO = 0.95
+    CLIMB_TIMEOUT = 45.0
+    # Longest wait for a streamed sample before reading MAVSDK directly
+    POSITION_SAMPLE_TIMEOUT = 1.0
+    # Executor deadline: the climb plus arming, setting altitude and the takeoff call
+    timeout = CLIMB_TIMEOUT + 30.0
+
     def validate_params(self) -> None:
         """Validate takeoff parameters."""
         altitude = self.params.get("altitude", 10.0)
@@ -37,14 +45,20 @@ class TakeoffCommand(BaseCommand):
         Returns:
             bool: True if on ground (relative altitude < 0.5m), False if airborne
         """
-        drone = backend.drone
+        position = backend.get_cached_position()
+        if position is not None:
+            relative_alt = position["relative_altitude"]
+        else:
+            relative_alt = await self._read_relative_altitude(backend.drone)
 
-        async for position in drone.telemetry.position():
-            relative_alt = position.relative_altitude_m
-            is_on_ground = relative_alt < 0.5
+        print(f"📊 Current relative altitude: {relative_alt:.2f}m")
+        return relative_alt < 0.5
 
-            print(f"📊 Current relative altitude: {relative_alt:.2f}m")
-            return is_on_ground
+    @staticmethod
+    async def _read_relative_altitude(drone) -> float:
+        """Read one relative altitude sample from a MAVSDK position subscription."""
+        async for sample in drone.telemetry.position():
+            return sample.relative_altitude_m
 
     async def execute(self, backend) -> CommandResult:
         """Execute takeoff using MAVSDK backend."""
@@ -88,8 +102,32 @@ class TakeoffCommand(BaseCommand):
             print(f"🚀 Taking off to {altitude}m...")
             await drone.action.takeoff()
 
-            # Wait for takeoff completion
-            await asyncio.sleep(8)
+            # Wait for the climb to finish, woken by each streamed position sample
+            target_alt = altitude * self.ALTITUDE_REACHED_RATIO
+            deadline = time.monotonic() + self.CLIMB_TIMEOUT
+            while (remaining := deadline - time.monotonic()) > 0:
+                position = await backend.wait_for_position(
+                    min(remaining, self.POSITION_SAMPLE_TIMEOUT)
+                )
+                if position is not None:
+                    relative_alt = position["relative_altitude"]
+                else:
+                    # Telemetry stream is silent - read the altitude from MAVSDK directly
+                    try:
+                        async with asyncio.timeout(deadline - time.monotonic()):
+                            relative_alt = await self._read_relative_altitude(drone)
+                    except TimeoutError:
+                        continue
+                if relative_alt >= target_alt:
+                    break
+            else:
+                duration = time.time() - start_time
+                return CommandResult(
+                    success=False,
+                    message=f"Takeoff did not reach {altitude}m within {self.CLIMB_TIMEOUT:.0f}s",
+                    error="timeout",
+                    duration=duration,
+                )
 
             duration = time.time() - start_time
 
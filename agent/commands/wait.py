@@ -25,6 +25,8 @@ class WaitCommand(BaseCommand):
         - message: Optional status message to display during wait
     """
 
+    timeout = None  # Bounded by the validated duration
+
     def validate_params(self) -> None:
         """Validate wait command parameters."""
         if "duration" not in self.params:
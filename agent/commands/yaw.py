@@ -1,11 +1,14 @@
 """Yaw command implementation."""
 import asyncio
+import logging
 import time
 
 from shared.models import CommandResult
 
 from .base import BaseCommand
 
+logger = logging.getLogger(__name__)
+
 
 class YawCommand(BaseCommand):
     """Rotate drone to specified heading."""
@@ -21,15 +24,20 @@ class YawCommand(BaseCommand):
 
     async def _check_flight_state(self, backend) -> None:
         """Check if drone is armed and airborne."""
-        drone = backend.drone
-        async for is_armed in drone.telemetry.armed():
-            if not is_armed:
-                raise RuntimeError("yaw command requires drone to be armed. Use takeoff first.")
-            break
-        async for position in drone.telemetry.position():
-            if position.relative_altitude_m < 0.5:
-                raise RuntimeError("yaw command requires drone to be airborne. Use takeoff first.")
-            break
+        cached = backend.get_cached_flight_state()
+        if cached is not None:
+            is_armed, relative_altitude = cached
+        else:
+            drone = backend.drone
+            async for is_armed in drone.telemetry.armed():
+                break
+            async for position in drone.telemetry.position():
+                relative_altitude = position.relative_altitude_m
+                break
+        if not is_armed:
+            raise RuntimeError("yaw command requires drone to be armed. Use takeoff first.")
+        if relative_altitude < 0.5:
+            raise RuntimeError("yaw command requires drone to be airborne. Use takeoff first.")
 
     async def execute(self, backend) -> CommandResult:
         """Execute yaw rotation using MAVSDK set_current_heading."""
@@ -53,7 +61,10 @@ class YawCommand(BaseCommand):
             timeout = 30.0
             check_interval = 0.5
             tolerance = 2.0
+            progress_interval = 5.0
             elapsed = 0.0
+            next_progress_log = 0.0
+            debug_progress = logger.isEnabledFor(logging.DEBUG)  # checked once per command
             while elapsed < timeout:
                 async for attitude in drone.telemetry.attitude_euler():
                     current_heading = attitude.yaw_deg % 360
@@ -65,8 +76,11 @@ class YawCommand(BaseCommand):
                             message=f"Yaw to {heading}° completed (actual: {current_heading:.1f}°)",
                             duration=duration,
                         )
-                    if elapsed % 5.0 < check_interval:
-                        print(f"   📊 Current heading: {current_heading:.1f}°, Δ={diff:.1f}°")
+                    if debug_progress and elapsed >= next_progress_log:
+                        logger.debug(
+                            "yaw progress: heading %.1f°, Δ=%.1f°", current_heading, diff
+                        )
+                        next_progress_log += progress_interval
                     break
                 await asyncio.sleep(check_interval)
                 elapsed += check_interval
@@ -10,23 +10,33 @@ from typing import Any, Dict, List, Optional
 
 from shared.models import Command, CommandMode, CommandResult
 
-from .command_registry import CommandRegistry
+from .command_registry import CommandRegistry, get_command_registry
 from .commands.rtl import RTLCommand  # Keep for emergency RTL
 
 logger = logging.getLogger(__name__)
 
+# What a failed command does to the rest of its sequence, by command mode;
+# modes not listed abort the sequence
+_FAILURE_BEHAVIOR: Dict[CommandMode, str] = {
+    CommandMode.CRITICAL: "rtl",
+    CommandMode.CONTINUE: "continue",
+    CommandMode.SKIP: "continue",
+}
+
 
 class CommandExecutor:
     """Executes command sequences with dynamic command loading."""
 
-    def __init__(self, backend):
+    def __init__(self, backend, registry: Optional[CommandRegistry] = None):
         """Initialize executor with backend connection.
 
         Args:
             backend: MAVSDK backend instance for drone communication
+            registry: Pre-populated command registry (defaults to the shared
+                      global registry, discovered once per process)
         """
         self.backend = backend
-        self.registry = CommandRegistry()
+        self.registry = registry
         self.current_sequence = []
         self.executing = False
 
@@ -36,7 +46,8 @@ class CommandExecutor:
     def _initialize_commands(self):
         """Initialize dynamic command registry."""
         try:
-            self.registry.discover_and_register()
+            if self.registry is None:
+                self.registry = get_command_registry()
             logger.info(f"🚀 Loaded {len(self.registry.commands)} commands dynamically")
 
             # Verify critical commands are loaded
@@ -48,6 +59,8 @@ class CommandExecutor:
         except Exception as e:
             logger.error(f"Failed to initialize command registry: {e}")
             # Fall back to empty registry (will fail gracefully on command execution)
+            if self.registry is None:
+                self.registry = CommandRegistry()
 
     async def execute_sequence(self, commands: List[Command]) -> List[CommandResult]:
         """Execute a sequence of commands with proper error handling.
@@ -65,6 +78,11 @@ class CommandExecutor:
         self.current_sequence = commands.copy()
         results = []
 
+        # Resolve registry and backend lookups once per sequence, not per command
+        get_command_class = self.registry.get_command_class
+        validate_params = self.registry.validate_params
+        backend = self.backend
+
         try:
             print(f"🚀 Starting command sequence with {len(commands)} commands")
 
@@ -72,7 +90,7 @@ class CommandExecutor:
                 print(f"\n📋 [{i+1}/{len(commands)}] Executing: {cmd.name}")
 
                 # Validate command exists
-                command_class = self.registry.get_command_class(cmd.name)
+                command_class = get_command_class(cmd.name)
                 if not command_class:
                     result = CommandResult(
                         success=False,
@@ -81,19 +99,12 @@ class CommandExecutor:
                     )
                     results.append(result)
 
-                    if cmd.mode == CommandMode.CRITICAL:
-                        print("💥 Critical command failed - triggering emergency RTL")
-                        await self._emergency_rtl()
+                    if await self._handle_failure(cmd, "failure"):
                         break
-                    elif cmd.mode == CommandMode.ABORT_ON_FAIL:
-                        print("🛑 Command sequence aborted due to failure")
-                        break
-                    else:
-                        print("⚠️  Continuing sequence despite command failure")
-                        continue
+                    continue
 
                 # Validate parameters
-                validation_errors = self.registry.validate_params(cmd.name, cmd.params)
+                validation_errors = validate_params(cmd.name, cmd.params)
                 if validation_errors:
                     result = CommandResult(
                         success=False,
@@ -102,33 +113,32 @@ class CommandExecutor:
                     )
                     results.append(result)
 
-                    if cmd.mode == CommandMode.CRITICAL:
-                        print("💥 Critical command validation failed - triggering emergency RTL")
-                        await self._emergency_rtl()
+                    if await self._handle_failure(cmd, "validation failure"):
                         break
-                    else:
-                        print("⚠️  Continuing despite validation failure")
-                        continue
+                    continue
 
                 # Execute command
                 try:
                     command_instance = command_class(cmd.name, cmd.params)
-                    result = await command_instance.execute(self.backend)
+                    command_start = time.time()
+                    try:
+                        async with asyncio.timeout(command_instance.timeout):
+                            result = await command_instance.execute(backend)
+                    except TimeoutError:
+                        result = CommandResult(
+                            success=False,
+                            message=f"{cmd.name} timed out after {command_instance.timeout}s",
+                            error="timeout",
+                            duration=time.time() - command_start,
+                        )
                     results.append(result)
 
                     # Handle failure based on command mode
                     if not result.success:
                         print(f"⚠️  Command {cmd.name} failed: {result.message}")
 
-                        if cmd.mode == CommandMode.CRITICAL:
-                            print("💥 Critical command failed - triggering emergency RTL")
-                            await self._emergency_rtl()
-                            break
-                        elif cmd.mode == CommandMode.ABORT_ON_FAIL:
-                            print("🛑 Command sequence aborted due to failure")
+                        if await self._handle_failure(cmd, "failure"):
                             break
-                        else:
-                            print("⚠️  Continuing sequence despite command failure")
                     else:
                         print(f"✅ Command {cmd.name} completed successfully")
 
@@ -139,15 +149,8 @@ class CommandExecutor:
                     )
                     results.append(result)
 
-                    if cmd.mode == CommandMode.CRITICAL:
-                        print("💥 Critical command exception - triggering emergency RTL")
-                        await self._emergency_rtl()
-                        break
-                    elif cmd.mode == CommandMode.ABORT_ON_FAIL:
-                        print("🛑 Command sequence aborted due to exception")
+                    if await self._handle_failure(cmd, "exception"):
                         break
-                    else:
-                        print("⚠️  Continuing sequence despite exception")
 
             print(f"\n🏁 Command sequence completed. {len(results)} commands processed.")
 
@@ -157,6 +160,27 @@ class CommandExecutor:
 
         return results
 
+    async def _handle_failure(self, cmd: Command, reason: str) -> bool:
+        """Apply the failed command's mode to the running sequence.
+
+        Args:
+            cmd: Command that failed
+            reason: Short failure description for log output
+
+        Returns:
+            bool: True if the sequence must stop, False to continue
+        """
+        behavior = _FAILURE_BEHAVIOR.get(cmd.mode, "abort")
+        if behavior == "rtl":
+            print(f"💥 Critical command {reason} - triggering emergency RTL")
+            await self._emergency_rtl()
+            return True
+        if behavior == "abort":
+            print(f"🛑 Command sequence aborted due to {reason}")
+            return True
+        print(f"⚠️  Continuing sequence despite {reason}")
+        return False
+
     async def _emergency_rtl(self):
         """Execute emergency return-to-launch."""
         try:
@@ -26,7 +26,12 @@ def main():
     print("📊 Detailed health: http://localhost:8001/health/detailed")
     print("-" * 50)
 
-    uvicorn.run(app, host="0.0.0.0", port=8001, log_level="info", access_log=True)
+    # "auto" selects uvloop when installed; DRONESPHERE_USE_UVLOOP=false forces asyncio
+    loop = "auto" if os.getenv("DRONESPHERE_USE_UVLOOP", "true").lower() == "true" else "asyncio"
+
+    uvicorn.run(
+        app, host="0.0.0.0", port=8001, loop=loop, log_level="info", access_log=True
+    )
 
 
 if __name__ == "__main__":
@@ -17,6 +17,9 @@ import asyncio
 import json
 import logging
 import os
+import signal
+import sys
+import threading
 from typing import Any, Dict, List, Optional, Sequence
 
 import httpx
@@ -35,6 +38,11 @@ load_dotenv()
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger("dronesphere-mcp")
 
+# Add project root to Python path for the shared package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.http_client import close_http_client, get_http_client  # noqa: E402
+
 
 class DroneCommand(BaseModel):
     """Structured drone command matching DroneSphere universal protocol."""
@@ -266,47 +274,47 @@ class DroneController:
             "queue_mode": "override",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                logger.info(f"Executing {len(commands)} commands on drone {target_drone}")
-                response = await client.post(
-                    f"{self.server_url}/fleet/commands", json=request_data, timeout=self.timeout
-                )
+        client = get_http_client()
+        try:
+            logger.info(f"Executing {len(commands)} commands on drone {target_drone}")
+            response = await client.post(
+                f"{self.server_url}/fleet/commands", json=request_data, timeout=self.timeout
+            )
 
-                if response.status_code == 200:
-                    result = response.json()
-                    logger.info(
-                        f"Commands executed successfully: {result.get('successful_commands', 0)}/{result.get('total_commands', 0)}"
-                    )
-                    return result
-                else:
-                    error_msg = f"Server error: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    return {"success": False, "error": error_msg}
-
-            except httpx.TimeoutException:
-                error_msg = f"Timeout after {self.timeout}s waiting for drone response"
-                logger.error(error_msg)
-                return {"success": False, "error": error_msg}
-            except Exception as e:
-                error_msg = f"Communication error: {str(e)}"
+            if response.status_code == 200:
+                result = response.json()
+                logger.info(
+                    f"Commands executed successfully: {result.get('successful_commands', 0)}/{result.get('total_commands', 0)}"
+                )
+                return result
+            else:
+                error_msg = f"Server error: {response.status_code} - {response.text}"
                 logger.error(error_msg)
                 return {"success": False, "error": error_msg}
 
+        except httpx.TimeoutException:
+            error_msg = f"Timeout after {self.timeout}s waiting for drone response"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg}
+        except Exception as e:
+            error_msg = f"Communication error: {str(e)}"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg}
+
     async def get_drone_status(self, target_drone: int) -> Dict[str, Any]:
         """Get drone status from DroneSphere server."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(f"{self.server_url}/fleet/health", timeout=10.0)
+        client = get_http_client()
+        try:
+            response = await client.get(f"{self.server_url}/fleet/health", timeout=10.0)
 
-                if response.status_code == 200:
-                    fleet_health = response.json()
-                    return fleet_health.get("drones", {}).get(str(target_drone), {})
-                else:
-                    return {"error": f"Status check failed: {response.status_code}"}
+            if response.status_code == 200:
+                fleet_health = response.json()
+                return fleet_health.get("drones", {}).get(str(target_drone), {})
+            else:
+                return {"error": f"Status check failed: {response.status_code}"}
 
-            except Exception as e:
-                return {"error": f"Status check error: {str(e)}"}
+        except Exception as e:
+            return {"error": f"Status check error: {str(e)}"}
 
 
 class MCPDroneServer:
@@ -520,11 +528,61 @@ class MCPDroneServer:
             )
 
 
+def _install_shutdown_handlers(callback) -> None:
+    """Route SIGINT/SIGTERM to callback on the running event loop.
+
+    Signal handlers can only be installed from the main thread; when the
+    server is embedded elsewhere the host process owns signal handling.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        logger.debug("Not running in main thread - skipping signal handlers")
+        return
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, callback)
+        except NotImplementedError:
+            # Windows event loops do not support add_signal_handler
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(callback))
+
+
 async def main():
     """Main entry point for MCP server."""
+    run_task: Optional[asyncio.Task] = None
+
+    def request_shutdown() -> None:
+        if run_task is not None:
+            run_task.cancel()
+
+    # Signal callbacks only run once the loop regains control, and the first await
+    # below is on run_task, so a Ctrl-C during setup still cancels the server run
+    _install_shutdown_handlers(request_shutdown)
+
     server = MCPDroneServer()
-    await server.run()
+    run_task = asyncio.create_task(server.run())
+
+    try:
+        await run_task
+    except asyncio.CancelledError:
+        logger.info("DroneSphere MCP Server stopped")
+    finally:
+        await close_http_client()
+
+
+def _run(coro) -> None:
+    """Run coroutine on uvloop when available (DRONESPHERE_USE_UVLOOP=false disables)."""
+    if os.getenv("DRONESPHERE_USE_UVLOOP", "true").lower() == "true":
+        try:
+            import uvloop
+
+            uvloop.run(coro)
+            return
+        except ImportError:
+            pass
+
+    asyncio.run(coro)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    _run(main())
@@ -117,10 +117,10 @@ import asyncio
 import json
 import logging
 import os
+import sys
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
-import httpx
 from dotenv import load_dotenv
 from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -136,6 +136,16 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("dronesphere-enhanced-bridge")
 
+# Add project root to Python path for the shared package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.http_client import close_http_client, get_http_client  # noqa: E402
+
+
+def _numeric(value: Any, default: float = 0.0) -> float:
+    """Return value if it is a number, otherwise default (for telemetry formatting)."""
+    return value if isinstance(value, (int, float)) else default
+
 
 class ChatMessage(BaseModel):
     """Chat message from user."""
@@ -164,29 +174,38 @@ class RobustTelemetryManager:
             return self.cached_telemetry
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"http://localhost:8002/fleet/telemetry/1/live", timeout=3.0
-                )
+            client = get_http_client()
+            response = await client.get(
+                f"http://localhost:8002/fleet/telemetry/1/live", timeout=3.0
+            )
 
-                if response.status_code == 200:
-                    telemetry = response.json()
-                    # Update all cache layers
-                    self.cached_telemetry = telemetry
-                    self.last_known_good_telemetry = telemetry.copy()
-                    self.cache_timestamp = datetime.now()
-                    self.consecutive_failures = 0
-                    logger.debug("Successfully fetched live telemetry")
-                    return telemetry
-                else:
-                    self.consecutive_failures += 1
-                    return self._get_robust_fallback()
+            if response.status_code == 200:
+                telemetry = response.json()
+                self.record_live(telemetry)
+                logger.debug("Successfully fetched live telemetry")
+                return telemetry
+            else:
+                self.consecutive_failures += 1
+                return self._get_robust_fallback()
 
         except Exception as e:
             self.consecutive_failures += 1
             logger.warning(f"Telemetry fetch failed (attempt {self.consecutive_failures}): {e}")
             return self._get_robust_fallback()
 
+    def record_live(self, telemetry: Dict[str, Any]) -> None:
+        """Store a freshly fetched telemetry snapshot in all cache layers."""
+        self.cached_telemetry = telemetry
+        self.last_known_good_telemetry = telemetry.copy()
+        self.cache_timestamp = datetime.now()
+        self.consecutive_failures = 0
+
+    def cached_or_fallback(self) -> Dict[str, Any]:
+        """Get cached or fallback telemetry without making another request."""
+        if self._is_cache_valid():
+            return self.cached_telemetry
+        return self._get_robust_fallback()
+
     def _is_cache_valid(self) -> bool:
         """Check if cached telemetry is still valid."""
         if not self.cached_telemetry or not self.cache_timestamp:
@@ -260,36 +279,19 @@ class RobustTelemetryManager:
         bat = telemetry.get('battery', {})
 
         # Current altitude for command context - with safe type checking
-        current_alt = pos.get('relative_altitude', 0.0)
-        if not isinstance(current_alt, (int, float)):
-            current_alt = 0.0
+        current_alt = _numeric(pos.get('relative_altitude', 0.0))
 
         altitude_context = f"🎯 CURRENT ALTITUDE: {current_alt:.1f}m (USE THIS as default when altitude not specified!)"
 
-        # Safe value extraction with defaults
-        lat = pos.get('latitude', 0.0)
-        lon = pos.get('longitude', 0.0)
-        alt_msl = pos.get('altitude', 0.0)
-        roll = att.get('roll', 0.0)
-        pitch = att.get('pitch', 0.0)
-        yaw = att.get('yaw', 0.0)
-        battery_pct = bat.get('remaining_percent', 0.0)
-        voltage = bat.get('voltage', 0.0)
-
-        # Ensure numeric types
-        for val_name, val in [
-            ('lat', lat),
-            ('lon', lon),
-            ('alt_msl', alt_msl),
-            ('current_alt', current_alt),
-            ('roll', roll),
-            ('pitch', pitch),
-            ('yaw', yaw),
-            ('battery_pct', battery_pct),
-            ('voltage', voltage),
-        ]:
-            if not isinstance(val, (int, float)):
-                locals()[val_name] = 0.0
+        # Safe value extraction with defaults (non-numeric values become 0.0)
+        lat = _numeric(pos.get('latitude', 0.0))
+        lon = _numeric(pos.get('longitude', 0.0))
+        alt_msl = _numeric(pos.get('altitude', 0.0))
+        roll = _numeric(att.get('roll', 0.0))
+        pitch = _numeric(att.get('pitch', 0.0))
+        yaw = _numeric(att.get('yaw', 0.0))
+        battery_pct = _numeric(bat.get('remaining_percent', 0.0))
+        voltage = _numeric(bat.get('voltage', 0.0))
 
         return f"""
 {warning_msg}🚁 DRONE TELEMETRY (Updated: {time_str}):
@@ -393,7 +395,7 @@ class EnhancedLLMController:
             # 1. Fetch telemetry robustly
             logger.info(f"🔍 Processing command: '{user_input}' for drone {target_drone}")
             telemetry = await self.telemetry_manager.get_live_telemetry(target_drone)
-            logger.debug(f"📊 Telemetry retrieved: {telemetry.get('timestamp', 'no_timestamp')}")
+            logger.debug("📊 Telemetry retrieved: %s", telemetry.get('timestamp', 'no_timestamp'))
 
             # 2. Create intelligent system prompt
             system_prompt = self._create_intelligent_prompt(telemetry, user_input)
@@ -712,6 +714,10 @@ class EnhancedLLMWebBridge:
             )
             return response
 
+        @self.app.on_event("shutdown")
+        async def close_shared_client():
+            await close_http_client()
+
         self.llm_controller = EnhancedLLMController()
         self.setup_routes()
 
@@ -797,39 +803,43 @@ class EnhancedLLMWebBridge:
 
         @self.app.get("/api/drone-telemetry")
         async def get_drone_telemetry_proxy():
-            """Enhanced telemetry proxy with fallback - CRITICAL for frontend."""
+            """Enhanced telemetry proxy with fallback - CRITICAL for frontend.
+
+            Makes at most one request per call: a successful fetch refreshes the
+            shared telemetry cache, and failures are served from that cache.
+            """
+            telemetry_manager = self.llm_controller.telemetry_manager
             try:
                 # First try direct telemetry service
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        "http://localhost:8002/fleet/telemetry/1/live", timeout=3.0
-                    )
-                    if response.status_code == 200:
-                        telemetry = response.json()
-                        logger.debug("Telemetry proxy: Direct fetch successful")
-                        return {
-                            **telemetry,
-                            "formatted_timestamp": self._format_telemetry_time(telemetry),
-                            "proxy_source": "direct",
-                        }
-                    else:
-                        logger.warning(f"Direct telemetry failed: {response.status_code}")
-                        # Fall back to our cached telemetry
-                        cached_telemetry = (
-                            await self.llm_controller.telemetry_manager.get_live_telemetry(1)
-                        )
-                        return {
-                            **cached_telemetry,
-                            "formatted_timestamp": self._format_telemetry_time(cached_telemetry),
-                            "proxy_source": "cached",
-                        }
+                client = get_http_client()
+                response = await client.get(
+                    "http://localhost:8002/fleet/telemetry/1/live", timeout=3.0
+                )
+                if response.status_code == 200:
+                    telemetry = response.json()
+                    telemetry_manager.record_live(telemetry)
+                    logger.debug("Telemetry proxy: Direct fetch successful")
+                    return {
+                        **telemetry,
+                        "formatted_timestamp": self._format_telemetry_time(telemetry),
+                        "proxy_source": "direct",
+                    }
+                else:
+                    logger.warning(f"Direct telemetry failed: {response.status_code}")
+                    # Fall back to our cached telemetry
+                    telemetry_manager.consecutive_failures += 1
+                    cached_telemetry = telemetry_manager.cached_or_fallback()
+                    return {
+                        **cached_telemetry,
+                        "formatted_timestamp": self._format_telemetry_time(cached_telemetry),
+                        "proxy_source": "cached",
+                    }
             except Exception as e:
                 logger.warning(f"Telemetry proxy error: {e}")
                 # Return cached/fallback telemetry
                 try:
-                    fallback_telemetry = (
-                        await self.llm_controller.telemetry_manager.get_live_telemetry(1)
-                    )
+                    telemetry_manager.consecutive_failures += 1
+                    fallback_telemetry = telemetry_manager.cached_or_fallback()
                     return {
                         **fallback_telemetry,
                         "formatted_timestamp": self._format_telemetry_time(fallback_telemetry),
@@ -1078,21 +1088,21 @@ class EnhancedLLMWebBridge:
         """Execute commands asynchronously in background."""
         try:
             logger.info(f"Executing {len(commands)} commands in background...")
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "http://localhost:8002/fleet/commands",
-                    json={
-                        "commands": commands,
-                        "target_drone": target_drone,
-                        "queue_mode": "override",
-                    },
-                    timeout=120.0,
-                )
+            client = get_http_client()
+            response = await client.post(
+                "http://localhost:8002/fleet/commands",
+                json={
+                    "commands": commands,
+                    "target_drone": target_drone,
+                    "queue_mode": "override",
+                },
+                timeout=120.0,
+            )
 
-                if response.status_code == 200:
-                    logger.info("Background command execution successful")
-                else:
-                    logger.error(f"Background execution failed: {response.status_code}")
+            if response.status_code == 200:
+                logger.info("Background command execution successful")
+            else:
+                logger.error(f"Background execution failed: {response.status_code}")
 
         except Exception as e:
             logger.error(f"Background command execution error: {e}")
@@ -4,7 +4,10 @@ Path: mcp-server/core/drone_api.py
 """
 
 import asyncio
+import itertools
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -12,6 +15,13 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Most recent commands whose status stays queryable via get_command_status
+COMMAND_STATUS_HISTORY = 1024
+
+# base_url scheme for a server listening on a Unix socket, e.g.
+# http+unix:///run/dronesphere.sock (uvicorn server.api:app --uds /run/dronesphere.sock)
+UDS_URL_PREFIX = "http+unix://"
+
 
 class DroneAPI:
     """Client for DroneSphere server API with non-blocking command execution."""
@@ -20,22 +30,45 @@ class DroneAPI:
         """Initialize API client.
 
         Args:
-            base_url: DroneSphere server URL (e.g., http://localhost:8002)
+            base_url: DroneSphere server URL (e.g., http://localhost:8002), or
+                http+unix:///path/to/socket for a co-located server on a Unix socket
             timeout: Request timeout in seconds
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+
+        limits = httpx.Limits(
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=60.0,
+        )
+        # Co-located server over a Unix socket skips loopback TCP entirely
+        transport = None
+        client_base_url = self.base_url
+        if self.base_url.startswith(UDS_URL_PREFIX):
+            socket_path = self.base_url[len(UDS_URL_PREFIX) :]
+            transport = httpx.AsyncHTTPTransport(uds=socket_path, limits=limits)
+            client_base_url = "http://dronesphere"
+
+        # One long-lived keep-alive pool to the single server we talk to; relative
+        # request paths resolve against base_url
         self.client = httpx.AsyncClient(
+            base_url=client_base_url,
+            transport=transport,
             timeout=httpx.Timeout(
                 connect=2.0,  # Quick connection
                 read=30.0,  # Allow time for execution
                 write=5.0,
                 pool=5.0,
-            )
+            ),
+            limits=limits,
         )
         self._telemetry_cache = {}
         self._cache_time = {}
-        self._command_status = {}  # Track command execution status
+        self._telemetry_inflight: Dict[int, asyncio.Task] = {}  # One fetch per drone at a time
+        # Track command execution status, oldest entries evicted first
+        self._command_status: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._command_seq = itertools.count(1)  # Keeps IDs unique within one timestamp tick
 
     async def send_commands(
         self, commands: List[Dict[str, Any]], drone_id: int = 1, queue_mode: str = "override"
@@ -50,7 +83,8 @@ class DroneAPI:
         Returns:
             Immediate acknowledgment with command ID for tracking
         """
-        command_id = f"cmd_{datetime.now().timestamp()}"
+        queued_at = datetime.now()
+        command_id = f"cmd_{queued_at.timestamp()}_{next(self._command_seq)}"
 
         # Start execution in background (fire and forget)
         asyncio.create_task(
@@ -62,9 +96,11 @@ class DroneAPI:
             "status": "queued",
             "commands": commands,
             "drone_id": drone_id,
-            "started_at": datetime.now().isoformat(),
+            "started_at": queued_at.isoformat(),
             "completed": False,
         }
+        if len(self._command_status) > COMMAND_STATUS_HISTORY:
+            self._command_status.popitem(last=False)
 
         # Return immediate acknowledgment
         return {
@@ -79,48 +115,38 @@ class DroneAPI:
         self, commands: List[Dict[str, Any]], drone_id: int, queue_mode: str, command_id: str
     ):
         """Execute commands in background without blocking."""
+        status = self._command_status[command_id]
         try:
             # Update status
-            self._command_status[command_id]["status"] = "executing"
+            status["status"] = "executing"
 
             # Send to drone server
             response = await self.client.post(
-                f"{self.base_url}/fleet/commands",
+                "/fleet/commands",
                 json={"commands": commands, "target_drone": drone_id, "queue_mode": queue_mode},
             )
 
             if response.status_code == 200:
-                result = response.json()
-                self._command_status[command_id].update(
-                    {
-                        "status": "completed",
-                        "completed": True,
-                        "result": result,
-                        "completed_at": datetime.now().isoformat(),
-                    }
-                )
-                logger.info(f"Command {command_id} completed successfully")
+                outcome = {"status": "completed", "result": response.json()}
+                logger.info("Command %s completed successfully", command_id)
             else:
-                self._command_status[command_id].update(
-                    {
-                        "status": "failed",
-                        "error": f"Server returned {response.status_code}",
-                        "completed": True,
-                        "completed_at": datetime.now().isoformat(),
-                    }
-                )
-                logger.error(f"Command {command_id} failed: {response.status_code}")
-
+                outcome = {"status": "failed", "error": f"Server returned {response.status_code}"}
+                logger.error("Command %s failed: %s", command_id, response.status_code)
+
+        except httpx.TimeoutException:
+            outcome = {"status": "error", "error": "Request to DroneSphere server timed out"}
+            logger.error("Command %s error: request timed out", command_id)
+        except httpx.ConnectError:
+            outcome = {"status": "error", "error": "Cannot connect to DroneSphere server"}
+            logger.error("Command %s error: cannot connect to server", command_id)
         except Exception as e:
-            self._command_status[command_id].update(
-                {
-                    "status": "error",
-                    "error": str(e),
-                    "completed": True,
-                    "completed_at": datetime.now().isoformat(),
-                }
-            )
-            logger.error(f"Command {command_id} error: {e}")
+            outcome = {"status": "error", "error": str(e)}
+            logger.error("Command %s error: %s", command_id, e)
+
+        # Single completion stamp for whichever branch ran
+        outcome["completed"] = True
+        outcome["completed_at"] = datetime.now().isoformat()
+        status.update(outcome)
 
     async def get_command_status(self, command_id: str) -> Dict[str, Any]:
         """Get status of a previously sent command.
@@ -147,21 +173,39 @@ class DroneAPI:
             Telemetry dict
         """
         cache_key = f"drone_{drone_id}"
-        now = datetime.now().timestamp()
+        now = time.time()
 
         # Check cache (2 second validity)
         if use_cache and cache_key in self._telemetry_cache:
             cache_age = now - self._cache_time.get(cache_key, 0)
             if cache_age < 2.0:
-                logger.debug(f"Using cached telemetry (age: {cache_age:.1f}s)")
+                logger.debug("Using cached telemetry (age: %.1fs)", cache_age)
                 return self._telemetry_cache[cache_key]
 
+        # Concurrent callers for the same drone share one in-flight request; the
+        # shield keeps one caller's cancellation from cancelling it for the rest
+        fetch = self._telemetry_inflight.get(drone_id)
+        if fetch is None:
+            fetch = asyncio.create_task(self._fetch_telemetry(drone_id, cache_key, now))
+            self._telemetry_inflight[drone_id] = fetch
+            fetch.add_done_callback(lambda _: self._telemetry_inflight.pop(drone_id, None))
+        return await asyncio.shield(fetch)
+
+    async def _fetch_telemetry(self, drone_id: int, cache_key: str, now: float) -> Dict[str, Any]:
+        """Fetch telemetry from the server, falling back to cached or default data.
+
+        Args:
+            drone_id: Target drone ID
+            cache_key: Telemetry cache key for the drone
+            now: Request time stored with a fresh result
+
+        Returns:
+            Telemetry dict
+        """
         try:
             # Quick telemetry fetch with short timeout
-            response = await asyncio.wait_for(
-                self.client.get(f"{self.base_url}/fleet/telemetry/{drone_id}"),
-                timeout=1.5,  # Very short timeout for telemetry
-            )
+            async with asyncio.timeout(1.5):  # Very short timeout for telemetry
+                response = await self.client.get(f"/fleet/telemetry/{drone_id}")
 
             if response.status_code == 200:
                 telemetry = response.json()
@@ -172,7 +216,7 @@ class DroneAPI:
             else:
                 logger.warning(f"Telemetry fetch failed: {response.status_code}")
 
-        except asyncio.TimeoutError:
+        except TimeoutError:
             logger.warning("Telemetry fetch timeout, using defaults")
         except Exception as e:
             logger.warning(f"Telemetry error: {e}")
@@ -7,12 +7,15 @@ Handles server initialization, lifecycle, and transport configuration.
 All tools are defined in tools.py for better organization.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Dict
 
@@ -31,12 +34,23 @@ from tools import register_all_tools
 # Load environment variables
 load_dotenv()
 
-# Configure logging
+# Resolve debug mode once; reused for the log level here and uvicorn's below
+DEBUG_MODE = os.getenv("DEBUG_MODE") == "true"
+
+# Configure logging: records are queued on the event-loop thread and written to
+# stderr by a listener thread, so tool calls never block on log I/O
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_stderr_handler = logging.StreamHandler(sys.stderr)
+_stderr_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _stderr_handler)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Full format applied by listener
 logging.basicConfig(
-    level=logging.INFO if os.getenv("DEBUG_MODE") == "true" else logging.WARNING,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    stream=sys.stderr,
+    level=logging.INFO if DEBUG_MODE else logging.WARNING,
+    handlers=[_queue_handler],
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush queued records on exit
 logger = logging.getLogger(__name__)
 
 
@@ -168,7 +182,7 @@ def main():
             app,
             host=host,
             port=port,
-            log_level="info" if os.getenv("DEBUG_MODE") == "true" else "warning",
+            log_level="info" if DEBUG_MODE else "warning",
         )
 
     else:
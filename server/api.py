@@ -6,15 +6,24 @@ background telemetry polling system for multi-drone monitoring.
 Path: server/api.py
 """
 import asyncio
+import functools
+import json
 import os
 import sys
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
-import requests
 from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    orjson = None
+    from fastapi.responses import JSONResponse as DefaultResponse
 
 from server.schemas_api import schemas_api
 
@@ -23,10 +32,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import the dynamic drone configuration system
 from shared.drone_config import get_fleet_config, reload_fleet_config
+from shared.http_client import close_http_client, get_http_client
 
 app = FastAPI(
     title="DroneSphere Server",
     version="2.0.1",
+    default_response_class=DefaultResponse,
     description="Fleet management server with dynamic configuration and telemetry polling",
 )
 
@@ -38,11 +49,100 @@ telemetry_cache: Dict[int, Dict[str, Any]] = {}
 telemetry_lock = threading.Lock()
 telemetry_thread: Optional[threading.Thread] = None
 is_polling = False
+# Polling thread's loop and stop event, so stop_telemetry_polling() can wake it immediately
+_polling_loop: Optional[asyncio.AbstractEventLoop] = None
+_polling_stop: Optional[asyncio.Event] = None
+TELEMETRY_POLL_INTERVAL = 2.0
+TELEMETRY_POLL_INTERVAL_ACTIVE = 0.5  # while any drone is armed
+TELEMETRY_POLL_CONCURRENCY = int(os.getenv("DRONESPHERE_TELEMETRY_CONCURRENCY", "32"))
+TELEMETRY_POLL_MAX_BACKOFF = 60.0
+
+# Unreachable drones, written only by the polling thread: id -> (failures, retry time)
+_poll_backoff: Dict[int, Tuple[int, float]] = {}
+
+# Short-lived /fleet/health snapshot shared by concurrent probes
+FLEET_HEALTH_TTL = 1.0
+_fleet_health_cache: Dict[str, Any] = {"ts": 0.0, "payload": None}
+_fleet_health_lock = asyncio.Lock()
+
+# Live telemetry reused for requests landing within one agent round-trip of each other
+LIVE_TELEMETRY_TTL = 0.1
+_live_telemetry_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+
+# Agent requests in flight per fleet-wide fan-out (health, batch live telemetry); the
+# rest queue here rather than spending their request timeout waiting on the pool
+AGENT_FANOUT_CONCURRENCY = int(os.getenv("DRONESPHERE_AGENT_CONCURRENCY", "32"))
+
+# Pool limits for the shared client used for agent requests (one connection per agent)
+AGENT_POOL_LIMITS = httpx.Limits(
+    max_connections=256, max_keepalive_connections=256, keepalive_expiry=60.0
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def agent_url(endpoint: str, path: str) -> httpx.URL:
+    """Build (and memoize) the URL for an agent endpoint.
+
+    Args:
+        endpoint: Agent "host:port"
+        path: Request path such as "/health"
+
+    Returns:
+        Parsed URL for the request
+    """
+    return httpx.URL(f"http://{endpoint}{path}")
+
 
+_JSON_HEADERS = {"content-type": "application/json"}
 
-def get_drone_registry() -> Dict[int, str]:
-    """Get current drone registry from YAML configuration."""
-    return get_fleet_config().get_active_registry_dict()
+
+def encode_json(payload: Any) -> bytes:
+    """Serialize a request body for an agent, using orjson when installed.
+
+    Args:
+        payload: JSON-compatible request data
+
+    Returns:
+        Encoded JSON body
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def decode_json(body: bytes) -> Any:
+    """Parse an agent response body, using orjson when installed.
+
+    Args:
+        body: Raw JSON response bytes
+
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+async def gather_agents(coros, return_exceptions: bool = False) -> List[Any]:
+    """Run agent requests concurrently, at most AGENT_FANOUT_CONCURRENCY at a time.
+
+    Args:
+        coros: Coroutines that each query one agent
+        return_exceptions: Passed through to asyncio.gather
+
+    Returns:
+        Results in the order of coros
+    """
+    semaphore = asyncio.Semaphore(AGENT_FANOUT_CONCURRENCY)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(
+        *(bounded(coro) for coro in coros), return_exceptions=return_exceptions
+    )
 
 
 def start_telemetry_polling():
@@ -60,88 +160,230 @@ def stop_telemetry_polling():
     """Stop background telemetry polling."""
     global is_polling
     is_polling = False
+    if _polling_loop is not None and _polling_stop is not None:
+        try:
+            _polling_loop.call_soon_threadsafe(_polling_stop.set)
+        except RuntimeError:
+            pass  # Poller already finished and closed its loop
     print("⏹️  Stopped fleet telemetry polling")
 
 
 def _telemetry_polling_worker():
-    """Background worker to poll drone telemetries.
+    """Background worker thread that runs the async telemetry poller."""
+    print("🔄 Telemetry polling worker started")
+    asyncio.run(_telemetry_polling_loop())
+    print("⏹️  Telemetry polling worker stopped")
 
-    Polls all active drones every 2 seconds and caches the results.
-    Handles connection errors gracefully and continues polling.
-    """
-    global telemetry_cache, is_polling
 
-    print("🔄 Telemetry polling worker started")
+async def _telemetry_polling_loop():
+    """Poll drone telemetries concurrently until polling is stopped.
 
-    while is_polling:
-        try:
-            fleet_config = get_fleet_config()
-            active_drones = fleet_config.get_active_drones()
-
-            if not active_drones:
-                print("⚠️  No active drones found, waiting...")
-                time.sleep(5.0)
-                continue
-
-            # Poll each active drone
-            for drone_config in active_drones:
-                drone_id = drone_config.id
-                endpoint = drone_config.endpoint
-
-                try:
-                    # Use requests for sync operation in thread
-                    response = requests.get(f"http://{endpoint}/telemetry", timeout=5.0)
-
-                    if response.status_code == 200:
-                        telemetry_data = response.json()
-
-                        # Add server metadata
-                        telemetry_data.update(
-                            {
-                                "server_timestamp": time.time(),
-                                "source": "polling",
-                                "drone_endpoint": endpoint,
-                                "drone_name": drone_config.name,
-                                "drone_type": drone_config.type,
-                                "drone_location": drone_config.location,
-                            }
+    Starts a poll of all active drones every ``telemetry_poll_interval`` seconds
+    (fleet defaults), or every ``telemetry_poll_interval_active`` seconds while any
+    drone is armed, and caches the results. Requests run in a task group
+    (bounded by a semaphore) over one keep-alive client, and drones whose
+    cached data is still fresh are skipped. Unreachable drones are retried
+    with per-drone exponential backoff, and repeated loop errors back off
+    exponentially.
+    """
+    global _polling_loop, _polling_stop
+    _polling_loop = asyncio.get_running_loop()
+    _polling_stop = asyncio.Event()
+    semaphore = asyncio.Semaphore(TELEMETRY_POLL_CONCURRENCY)
+
+    # One pooled connection per concurrent poll, kept alive well past the idle interval
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=TELEMETRY_POLL_CONCURRENCY,
+            max_keepalive_connections=TELEMETRY_POLL_CONCURRENCY,
+            keepalive_expiry=60.0,
+        )
+    ) as client:
+        bound_config = None
+        interval = TELEMETRY_POLL_INTERVAL
+        # GET /telemetry requests built once per agent endpoint and re-sent every cycle
+        telemetry_requests: Dict[str, httpx.Request] = {}
+        consecutive_errors = 0
+        while is_polling:
+            cycle_start = time.monotonic()
+            try:
+                fleet_config = get_fleet_config()
+                active_drones = fleet_config.get_active_drones()
+
+                # Re-read the configured intervals only when the fleet config is (re)loaded
+                if fleet_config is not bound_config:
+                    bound_config = fleet_config
+                    idle_interval = _configured_poll_interval(fleet_config)
+                    armed_interval = _configured_poll_interval(fleet_config, armed=True)
+                    interval = idle_interval
+                    telemetry_requests.clear()
+
+                if not active_drones:
+                    print("⚠️  No active drones found, waiting...")
+                    await _polling_pause(5.0)
+                    continue
+
+                # Skip drones polled (e.g. by a slow previous cycle) within half an interval,
+                # and unreachable drones still inside their backoff window
+                now = time.time()
+                fresh_after = now - interval * 0.5
+                with telemetry_lock:
+                    due_drones = [
+                        drone_config
+                        for drone_config in active_drones
+                        if telemetry_cache.get(drone_config.id, {}).get("server_timestamp", 0)
+                        < fresh_after
+                        and _poll_backoff.get(drone_config.id, (0, 0.0))[1] <= now
+                    ]
+
+                # Each task stores its own result, so the cache fills as responses arrive
+                async with asyncio.TaskGroup() as tg:
+                    for drone_config in due_drones:
+                        endpoint = drone_config.endpoint
+                        request = telemetry_requests.get(endpoint)
+                        if request is None:
+                            request = telemetry_requests[endpoint] = client.build_request(
+                                "GET", agent_url(endpoint, "/telemetry"), timeout=5.0
+                            )
+                        tg.create_task(
+                            _poll_drone_telemetry(client, semaphore, drone_config, request)
                         )
 
-                        with telemetry_lock:
-                            telemetry_cache[drone_id] = telemetry_data
-
-                    else:
-                        # Store error state
-                        with telemetry_lock:
-                            telemetry_cache[drone_id] = {
-                                "error": f"HTTP {response.status_code}",
-                                "server_timestamp": time.time(),
-                                "source": "polling_error",
-                                "drone_endpoint": endpoint,
-                                "drone_name": drone_config.name,
-                                "drone_type": drone_config.type,
-                            }
-
-                except requests.RequestException as e:
-                    # Store connection error
-                    with telemetry_lock:
-                        telemetry_cache[drone_id] = {
-                            "error": str(e),
-                            "server_timestamp": time.time(),
-                            "source": "connection_error",
-                            "drone_endpoint": endpoint,
-                            "drone_name": drone_config.name,
-                            "drone_type": drone_config.type,
-                        }
-
-            # Sleep between polls (2 second interval)
-            time.sleep(2.0)
-
-        except Exception as e:
-            print(f"❌ Telemetry polling error: {e}")
-            time.sleep(5.0)  # Longer sleep on error
+                # Poll faster while any drone is armed (flying), slower when the fleet is idle
+                with telemetry_lock:
+                    any_armed = any(
+                        telemetry_cache.get(drone_config.id, {}).get("armed")
+                        for drone_config in active_drones
+                    )
+                interval = armed_interval if any_armed else idle_interval
+                consecutive_errors = 0
 
-    print("⏹️  Telemetry polling worker stopped")
+                # Cycles start on a fixed cadence: time spent polling comes out of the
+                # pause instead of stretching the interval (no catch-up burst if overrun)
+                await _polling_pause(max(0.0, interval - (time.monotonic() - cycle_start)))
+
+            except Exception as e:
+                consecutive_errors += 1
+                print(f"❌ Telemetry polling error: {e}")
+                # Longer sleep on error, doubling up to 16x while errors repeat
+                await _polling_pause(5.0 * min(2 ** (consecutive_errors - 1), 16))
+
+
+async def _polling_pause(seconds: float) -> None:
+    """Sleep between poll cycles, returning early once polling is stopped.
+
+    Args:
+        seconds: Maximum time to wait
+    """
+    try:
+        async with asyncio.timeout(seconds):
+            await _polling_stop.wait()
+    except TimeoutError:
+        pass
+
+
+def _configured_poll_interval(fleet_config, armed: bool = False) -> float:
+    """Get the telemetry poll interval from the fleet defaults.
+
+    Args:
+        fleet_config: Loaded fleet configuration
+        armed: Return the interval used while any drone is armed
+
+    Returns:
+        Interval in seconds (``telemetry_poll_interval_active`` when armed,
+        otherwise ``telemetry_poll_interval``, falling back to module defaults)
+    """
+    idle = float(fleet_config.defaults.get("telemetry_poll_interval", TELEMETRY_POLL_INTERVAL))
+    if not armed:
+        return idle
+    return float(
+        fleet_config.defaults.get(
+            "telemetry_poll_interval_active", min(idle, TELEMETRY_POLL_INTERVAL_ACTIVE)
+        )
+    )
+
+
+async def _poll_drone_telemetry(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    drone_config,
+    request: httpx.Request,
+) -> None:
+    """Fetch telemetry for one drone and store it in the cache.
+
+    Args:
+        client: HTTP client owned by the polling loop
+        semaphore: Limits concurrent agent requests
+        drone_config: Configuration of the drone to poll
+        request: Prebuilt GET request for the drone's /telemetry endpoint
+    """
+    drone_id = drone_config.id
+    endpoint = drone_config.endpoint
+
+    try:
+        async with semaphore:
+            response = await client.send(request)
+
+        if response.status_code == 200:
+            telemetry_data = decode_json(response.content)
+
+            # Add server metadata
+            telemetry_data.update(
+                {
+                    "server_timestamp": time.time(),
+                    "source": "polling",
+                    "drone_endpoint": endpoint,
+                    "drone_name": drone_config.name,
+                    "drone_type": drone_config.type,
+                    "drone_location": drone_config.location,
+                }
+            )
+
+            with telemetry_lock:
+                telemetry_cache[drone_id] = telemetry_data
+            _poll_backoff.pop(drone_id, None)
+
+        else:
+            # Store error state
+            with telemetry_lock:
+                telemetry_cache[drone_id] = {
+                    "error": f"HTTP {response.status_code}",
+                    "server_timestamp": time.time(),
+                    "source": "polling_error",
+                    "drone_endpoint": endpoint,
+                    "drone_name": drone_config.name,
+                    "drone_type": drone_config.type,
+                }
+
+    except httpx.HTTPError as e:
+        # Classify common failures by type; unreachable drones fail every cycle
+        if isinstance(e, httpx.TimeoutException):
+            error = "Telemetry request timeout"
+        elif isinstance(e, httpx.ConnectError):
+            error = "Connection refused"
+        else:
+            error = str(e)
+
+        # Back off this drone only: 4s, 8s, 16s ... up to TELEMETRY_POLL_MAX_BACKOFF
+        now = time.time()
+        failures = _poll_backoff.get(drone_id, (0, 0.0))[0] + 1
+        delay = min(TELEMETRY_POLL_INTERVAL * 2**failures, TELEMETRY_POLL_MAX_BACKOFF)
+        _poll_backoff[drone_id] = (failures, now + delay)
+
+        # Store connection error
+        with telemetry_lock:
+            telemetry_cache[drone_id] = {
+                "error": error,
+                "server_timestamp": now,
+                "source": "connection_error",
+                "drone_endpoint": endpoint,
+                "drone_name": drone_config.name,
+                "drone_type": drone_config.type,
+            }
+
+    except Exception as e:
+        # Keep one bad response from cancelling the rest of the poll cycle
+        print(f"❌ Telemetry polling error for drone {drone_id}: {e}")
 
 
 @app.on_event("startup")
@@ -151,24 +393,27 @@ async def startup_event():
     fleet_config = get_fleet_config()
     print(f"📋 Loaded fleet: {fleet_config.fleet_name}")
     print(f"🚁 Active drones: {len(fleet_config.get_active_drones())}")
+    get_http_client(AGENT_POOL_LIMITS)
     start_telemetry_polling()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Stop telemetry polling on server shutdown."""
+    """Stop telemetry polling and close agent connections on server shutdown."""
     stop_telemetry_polling()
+    await close_http_client()
 
 
 @app.get("/health")
-async def health_check() -> Dict[str, Any]:
+def health_check() -> Dict[str, Any]:
     """Server health check endpoint with dynamic drone info."""
-    uptime = time.time() - SERVER_START_TIME
+    now = time.time()
+    uptime = now - SERVER_START_TIME
     fleet_config = get_fleet_config()
 
     return {
         "status": "healthy",
-        "timestamp": time.time(),
+        "timestamp": now,
         "service": "dronesphere-server",
         "version": "2.0.1",
         "uptime_seconds": round(uptime, 2),
@@ -207,74 +452,66 @@ async def route_commands(request: dict) -> Dict[str, Any]:
         if not target_drone:
             raise HTTPException(status_code=400, detail="target_drone required for fleet commands")
 
-        # Get current drone registry
-        drone_registry = get_drone_registry()
-
-        # Validate drone exists in registry
-        if target_drone not in drone_registry:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Drone {target_drone} not found in active registry. Available: {list(drone_registry.keys())}",
-            )
-
-        # Get drone configuration
+        # Single config lookup; only active drones are routable
         fleet_config = get_fleet_config()
         drone_config = fleet_config.get_drone(target_drone)
 
-        if not drone_config:
+        if drone_config is None or not drone_config.is_active:
             raise HTTPException(
-                status_code=404, detail=f"Drone {target_drone} configuration not found"
-            )
-
-        if not drone_config.is_active:
-            raise HTTPException(
-                status_code=503, detail=f"Drone {target_drone} ({drone_config.name}) is not active"
+                status_code=404,
+                detail=f"Drone {target_drone} not found in active registry. Available: {[d.id for d in fleet_config.get_active_drones()]}",
             )
 
         # Get drone endpoint
-        drone_endpoint = f"http://{drone_config.endpoint}"
+        drone_endpoint = drone_config.full_endpoint
 
         print(
             f"🎯 Routing {len(request.get('commands', []))} commands to drone {target_drone} ({drone_config.name}) at {drone_endpoint}"
         )
 
         # Forward exact payload to agent (universal protocol)
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{drone_endpoint}/commands",
-                    json=request,  # Forward exact request
-                    timeout=60.0,  # Longer timeout for command execution
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    print(
-                        f"✅ Commands routed successfully to drone {target_drone} ({drone_config.name})"
-                    )
-                    return result
-                else:
-                    raise HTTPException(
-                        status_code=response.status_code,
-                        detail=f"Agent returned error: {response.text}",
-                    )
+        client = get_http_client(AGENT_POOL_LIMITS)
+        try:
+            response = await client.post(
+                agent_url(drone_config.endpoint, "/commands"),
+                content=encode_json(request),  # Forward exact request
+                headers=_JSON_HEADERS,
+                timeout=60.0,  # Longer timeout for command execution
+            )
 
-            except httpx.TimeoutException:
-                raise HTTPException(
-                    status_code=504,
-                    detail=f"Timeout waiting for drone {target_drone} ({drone_config.name}) response",
-                )
-            except httpx.ConnectError:
-                raise HTTPException(
-                    status_code=503,
-                    detail=f"Cannot connect to drone {target_drone} ({drone_config.name}) at {drone_endpoint}",
+            if response.status_code == 200:
+                result = decode_json(response.content)
+                print(
+                    f"✅ Commands routed successfully to drone {target_drone} ({drone_config.name})"
                 )
-            except Exception as e:
+                return result
+            else:
                 raise HTTPException(
-                    status_code=503,
-                    detail=f"Communication error with drone {target_drone} ({drone_config.name}): {str(e)}",
+                    status_code=response.status_code,
+                    detail=f"Agent returned error: {response.text}",
                 )
 
+        except httpx.TimeoutException:
+            raise HTTPException(
+                status_code=504,
+                detail=f"Timeout waiting for drone {target_drone} ({drone_config.name}) response",
+            )
+        except httpx.ConnectError:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Cannot connect to drone {target_drone} ({drone_config.name}) at {drone_endpoint}",
+            )
+        except httpx.HTTPError as e:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Communication error with drone {target_drone} ({drone_config.name}): {str(e)}",
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=502,
+                detail=f"Invalid response from drone {target_drone} ({drone_config.name}): {str(e)}",
+            )
+
     except HTTPException:
         raise
     except Exception as e:
@@ -283,61 +520,40 @@ async def route_commands(request: dict) -> Dict[str, Any]:
 
 @app.get("/fleet/health")
 async def fleet_health() -> Dict[str, Any]:
-    """Get health status of all drones using dynamic configuration."""
+    """Get health status of all drones using dynamic configuration.
+
+    Results are memoized for FLEET_HEALTH_TTL seconds and concurrent callers
+    share one in-flight check, so frequent probes don't fan out to every agent.
+    """
+    if time.monotonic() - _fleet_health_cache["ts"] < FLEET_HEALTH_TTL:
+        return _fleet_health_cache["payload"]
+
+    async with _fleet_health_lock:
+        # Another caller may have refreshed the cache while we waited
+        if time.monotonic() - _fleet_health_cache["ts"] < FLEET_HEALTH_TTL:
+            return _fleet_health_cache["payload"]
+
+        payload = await _check_fleet_health()
+        _fleet_health_cache["payload"] = payload
+        _fleet_health_cache["ts"] = time.monotonic()
+        return payload
+
+
+async def _check_fleet_health() -> Dict[str, Any]:
+    """Query every active agent's /health endpoint and summarize the fleet."""
     fleet_config = get_fleet_config()
     health_status = {
         "timestamp": time.time(),
         "fleet_name": fleet_config.fleet_name,
         "total_drones": len(fleet_config.drones),
         "active_drones": len(fleet_config.get_active_drones()),
-        "drones": {},
     }
 
-    async with httpx.AsyncClient() as client:
-        # Check all drones (both active and inactive)
-        for drone_id, drone_config in fleet_config.drones.items():
-            endpoint = drone_config.endpoint
-
-            drone_status = {
-                "id": drone_id,
-                "name": drone_config.name,
-                "type": drone_config.type,
-                "configured_status": drone_config.status,
-                "endpoint": endpoint,
-                "location": drone_config.location,
-            }
-
-            if drone_config.is_active:
-                try:
-                    response = await client.get(f"http://{endpoint}/health", timeout=5.0)
-
-                    if response.status_code == 200:
-                        agent_health = response.json()
-                        drone_status.update(
-                            {
-                                "status": "healthy",
-                                "backend_connected": agent_health.get("backend_connected", False),
-                                "executor_ready": agent_health.get("executor_ready", False),
-                                "uptime_seconds": agent_health.get("uptime_seconds", 0),
-                            }
-                        )
-                    else:
-                        drone_status.update(
-                            {"status": "error", "error": f"HTTP {response.status_code}"}
-                        )
-
-                except httpx.TimeoutException:
-                    drone_status.update({"status": "timeout", "error": "Health check timeout"})
-                except httpx.ConnectError:
-                    drone_status.update({"status": "unreachable", "error": "Connection refused"})
-                except Exception as e:
-                    drone_status.update({"status": "error", "error": str(e)})
-            else:
-                drone_status.update(
-                    {"status": "inactive", "error": "Drone marked as inactive in configuration"}
-                )
-
-            health_status["drones"][drone_id] = drone_status
+    # Check all drones (both active and inactive) concurrently
+    drone_statuses = await gather_agents(
+        _check_drone_health(drone_config) for drone_config in fleet_config.drones.values()
+    )
+    health_status["drones"] = {status["id"]: status for status in drone_statuses}
 
     # Add summary statistics
     statuses = [drone["status"] for drone in health_status["drones"].values()]
@@ -352,8 +568,61 @@ async def fleet_health() -> Dict[str, Any]:
     return health_status
 
 
+async def _check_drone_health(drone_config) -> Dict[str, Any]:
+    """Build the health entry for one drone, querying its agent if active.
+
+    Args:
+        drone_config: Configuration of the drone to check
+
+    Returns:
+        Health status entry for the drone
+    """
+    endpoint = drone_config.endpoint
+
+    drone_status = {
+        "id": drone_config.id,
+        "name": drone_config.name,
+        "type": drone_config.type,
+        "configured_status": drone_config.status,
+        "endpoint": endpoint,
+        "location": drone_config.location,
+    }
+
+    if not drone_config.is_active:
+        drone_status.update(
+            {"status": "inactive", "error": "Drone marked as inactive in configuration"}
+        )
+        return drone_status
+
+    try:
+        client = get_http_client(AGENT_POOL_LIMITS)
+        response = await client.get(agent_url(endpoint, "/health"), timeout=5.0)
+
+        if response.status_code == 200:
+            agent_health = decode_json(response.content)
+            drone_status.update(
+                {
+                    "status": "healthy",
+                    "backend_connected": agent_health.get("backend_connected", False),
+                    "executor_ready": agent_health.get("executor_ready", False),
+                    "uptime_seconds": agent_health.get("uptime_seconds", 0),
+                }
+            )
+        else:
+            drone_status.update({"status": "error", "error": f"HTTP {response.status_code}"})
+
+    except httpx.TimeoutException:
+        drone_status.update({"status": "timeout", "error": "Health check timeout"})
+    except httpx.ConnectError:
+        drone_status.update({"status": "unreachable", "error": "Connection refused"})
+    except Exception as e:
+        drone_status.update({"status": "error", "error": str(e)})
+
+    return drone_status
+
+
 @app.get("/fleet/registry")
-async def get_registry() -> Dict[str, Any]:
+def get_registry() -> Dict[str, Any]:
     """Get current drone registry configuration from YAML."""
     fleet_config = get_fleet_config()
 
@@ -371,7 +640,7 @@ async def get_registry() -> Dict[str, Any]:
                 "description": drone_config.description,
                 "type": drone_config.type,
                 "status": drone_config.status,
-                "endpoint": f"http://{drone_config.endpoint}",
+                "endpoint": drone_config.full_endpoint,
                 "ip": drone_config.ip,
                 "port": drone_config.port,
                 "location": drone_config.location,
@@ -390,14 +659,14 @@ async def get_registry() -> Dict[str, Any]:
 
 
 @app.get("/fleet/config")
-async def get_fleet_config_endpoint() -> Dict[str, Any]:
+def get_fleet_config_endpoint() -> Dict[str, Any]:
     """Get complete fleet configuration including settings and environments."""
     fleet_config = get_fleet_config()
     return fleet_config.to_dict()
 
 
 @app.post("/fleet/config/reload")
-async def reload_fleet_config_endpoint() -> Dict[str, Any]:
+def reload_fleet_config_endpoint() -> Dict[str, Any]:
     """Reload fleet configuration from YAML file."""
     try:
         old_count = len(get_fleet_config().drones)
@@ -420,7 +689,7 @@ async def reload_fleet_config_endpoint() -> Dict[str, Any]:
 
 
 @app.get("/fleet/drones/{drone_id}")
-async def get_drone_info(drone_id: int) -> Dict[str, Any]:
+def get_drone_info(drone_id: int) -> Dict[str, Any]:
     """Get detailed information for a specific drone."""
     fleet_config = get_fleet_config()
     drone_config = fleet_config.get_drone(drone_id)
@@ -437,7 +706,7 @@ async def get_drone_info(drone_id: int) -> Dict[str, Any]:
 
 
 @app.get("/fleet/telemetry")
-async def get_fleet_telemetry() -> Dict[str, Any]:
+def get_fleet_telemetry() -> Dict[str, Any]:
     """Get telemetry data for all drones in the fleet.
 
     Returns cached telemetry data with metadata about freshness and polling status.
@@ -446,10 +715,11 @@ async def get_fleet_telemetry() -> Dict[str, Any]:
         Dict containing fleet-wide telemetry data with timestamps and metadata
     """
     fleet_config = get_fleet_config()
+    now = time.time()
 
     with telemetry_lock:
         fleet_telemetry = {
-            "timestamp": time.time(),
+            "timestamp": now,
             "fleet_name": fleet_config.fleet_name,
             "total_drones": len(fleet_config.drones),
             "active_drones": len(fleet_config.get_active_drones()),
@@ -464,7 +734,7 @@ async def get_fleet_telemetry() -> Dict[str, Any]:
 
                 # Calculate data age
                 server_timestamp = telemetry.get("server_timestamp", 0)
-                data_age = time.time() - server_timestamp
+                data_age = now - server_timestamp
                 telemetry["data_age_seconds"] = round(data_age, 2)
 
                 fleet_telemetry["drones"][drone_id] = telemetry
@@ -472,7 +742,7 @@ async def get_fleet_telemetry() -> Dict[str, Any]:
                 # No cached data available
                 fleet_telemetry["drones"][drone_id] = {
                     "error": "No telemetry data available",
-                    "server_timestamp": time.time(),
+                    "server_timestamp": now,
                     "source": "no_data",
                     "drone_name": drone_config.name,
                     "drone_type": drone_config.type,
@@ -495,8 +765,79 @@ async def get_fleet_telemetry() -> Dict[str, Any]:
         return fleet_telemetry
 
 
+def _backoff_info(entry: Optional[Tuple[int, float]], now: float) -> Optional[Dict[str, Any]]:
+    """Describe a drone's polling backoff for the status endpoint.
+
+    Args:
+        entry: (failures, retry time) from _poll_backoff, or None if not backed off
+        now: Current time
+
+    Returns:
+        Consecutive failures and seconds until the next poll, or None
+    """
+    if entry is None:
+        return None
+    failures, retry_at = entry
+    return {"failures": failures, "retry_in_seconds": round(max(retry_at - now, 0.0), 2)}
+
+
+# Declared before /fleet/telemetry/{drone_id}, which would otherwise capture "status"
+@app.get("/fleet/telemetry/status")
+def get_telemetry_status() -> Dict[str, Any]:
+    """Get status of the telemetry polling system.
+
+    Returns:
+        Status information about the background polling system
+    """
+    fleet_config = get_fleet_config()
+    now = time.time()
+
+    backoff = dict(_poll_backoff)
+
+    with telemetry_lock:
+        cache_info = {}
+        for drone_id, data in telemetry_cache.items():
+            cache_info[drone_id] = {
+                "drone_name": data.get("drone_name", f"Drone {drone_id}"),
+                "has_data": "error" not in data,
+                "age_seconds": round(now - data.get("server_timestamp", 0), 2),
+                "source": data.get("source", "unknown"),
+                "last_error": data.get("error") if "error" in data else None,
+                "backoff": _backoff_info(backoff.get(drone_id), now),
+            }
+
+    return {
+        "timestamp": now,
+        "polling_status": {
+            "active": is_polling,
+            "thread_alive": telemetry_thread.is_alive() if telemetry_thread else False,
+            "interval_seconds": _configured_poll_interval(fleet_config),
+            "backed_off_drones": sorted(backoff),
+        },
+        "fleet_info": {
+            "fleet_name": fleet_config.fleet_name,
+            "total_drones": len(fleet_config.drones),
+            "active_drones": len(fleet_config.get_active_drones()),
+            "cached_drones": len(telemetry_cache),
+        },
+        "cache_details": cache_info,
+        "system_health": {
+            "cache_hit_rate": f"{(len(telemetry_cache) / max(len(fleet_config.get_active_drones()), 1) * 100):.1f}%",
+            "oldest_data_age": max(
+                [
+                    now - data.get("server_timestamp", now)
+                    for data in telemetry_cache.values()
+                ],
+                default=0,
+            )
+            if telemetry_cache
+            else 0,
+        },
+    }
+
+
 @app.get("/fleet/telemetry/{drone_id}")
-async def get_drone_telemetry(drone_id: int) -> Dict[str, Any]:
+def get_drone_telemetry(drone_id: int) -> Dict[str, Any]:
     """Get telemetry data for a specific drone.
 
     Args:
@@ -533,13 +874,16 @@ async def get_drone_telemetry(drone_id: int) -> Dict[str, Any]:
 
 @app.get("/fleet/telemetry/{drone_id}/live")
 async def get_live_drone_telemetry(drone_id: int) -> Dict[str, Any]:
-    """Get real-time telemetry directly from drone (bypasses cache).
+    """Get real-time telemetry directly from drone (not the polling cache).
+
+    The agent is queried on demand; responses are reused for up to
+    LIVE_TELEMETRY_TTL (100 ms) so bursts of requests share one agent call.
 
     Args:
         drone_id: ID of the drone to get live telemetry for
 
     Returns:
-        Fresh telemetry data directly from the drone agent
+        Telemetry data from the drone agent, at most LIVE_TELEMETRY_TTL old
     """
     fleet_config = get_fleet_config()
     drone_config = fleet_config.get_drone(drone_id)
@@ -550,117 +894,169 @@ async def get_live_drone_telemetry(drone_id: int) -> Dict[str, Any]:
             detail=f"Drone {drone_id} not found in configuration. Available: {list(fleet_config.drones.keys())}",
         )
 
-    endpoint = drone_config.endpoint
+    return await _fetch_live_telemetry(drone_config)
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"http://{endpoint}/telemetry", timeout=10.0)
 
-            if response.status_code == 200:
-                telemetry = response.json()
-                telemetry.update(
-                    {
-                        "server_timestamp": time.time(),
-                        "source": "live_request",
-                        "drone_endpoint": endpoint,
-                        "drone_name": drone_config.name,
-                        "drone_type": drone_config.type,
-                        "drone_location": drone_config.location,
-                        "data_age_seconds": 0.0,  # Fresh data
-                    }
-                )
-                return telemetry
-            else:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Drone {drone_config.name} returned error: {response.text}",
-                )
+class LiveTelemetryRequest(BaseModel):
+    """Body of POST /fleet/telemetry/live."""
 
-        except httpx.TimeoutException:
-            raise HTTPException(
-                status_code=504,
-                detail=f"Timeout waiting for drone {drone_id} ({drone_config.name}) telemetry",
-            )
-        except httpx.ConnectError:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Cannot connect to drone {drone_id} ({drone_config.name}) at {endpoint}",
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Communication error with drone {drone_id} ({drone_config.name}): {str(e)}",
-            )
+    drone_ids: Optional[List[int]] = None  # all active drones if omitted
 
 
-@app.get("/fleet/telemetry/status")
-async def get_telemetry_status() -> Dict[str, Any]:
-    """Get status of the telemetry polling system.
+@app.post("/fleet/telemetry/live")
+async def get_live_fleet_telemetry(request: LiveTelemetryRequest) -> Dict[str, Any]:
+    """Get real-time telemetry from several drones in one request.
+
+    Agent requests run concurrently, so a dashboard gets N drones for the
+    latency of the slowest one instead of N sequential round-trips. Drones
+    marked inactive in the configuration are reported without being queried.
+
+    Args:
+        request: {"drone_ids": [1, 2, ...]}; all active drones if omitted
 
     Returns:
-        Status information about the background polling system
+        Per-drone live telemetry (or error details) keyed by drone ID
     """
     fleet_config = get_fleet_config()
-
-    with telemetry_lock:
-        cache_info = {}
-        for drone_id, data in telemetry_cache.items():
-            cache_info[drone_id] = {
-                "drone_name": data.get("drone_name", f"Drone {drone_id}"),
-                "has_data": "error" not in data,
-                "age_seconds": round(time.time() - data.get("server_timestamp", 0), 2),
-                "source": data.get("source", "unknown"),
-                "last_error": data.get("error") if "error" in data else None,
+    drone_ids = request.drone_ids
+
+    if drone_ids is None:
+        drone_ids = [drone_config.id for drone_config in fleet_config.get_active_drones()]
+
+    drone_configs = [fleet_config.get_drone(drone_id) for drone_id in drone_ids]
+    results = await gather_agents(
+        (_fetch_live_telemetry(d) for d in drone_configs if d is not None and d.is_active),
+        return_exceptions=True,
+    )
+
+    drones: Dict[int, Dict[str, Any]] = {}
+    fetched = iter(results)
+    inactive = 0
+    for drone_id, drone_config in zip(drone_ids, drone_configs):
+        if drone_config is None:
+            drones[drone_id] = {"error": "Drone not found in configuration", "status_code": 404}
+            continue
+        if not drone_config.is_active:
+            drones[drone_id] = {
+                "status": "inactive",
+                "error": "Drone marked as inactive in configuration",
             }
+            inactive += 1
+            continue
+
+        result = next(fetched)
+        if isinstance(result, HTTPException):
+            drones[drone_id] = {"error": result.detail, "status_code": result.status_code}
+        elif isinstance(result, Exception):
+            drones[drone_id] = {"error": str(result), "status_code": 500}
+        else:
+            drones[drone_id] = result
 
+    successful = sum(1 for d in drones.values() if "error" not in d)
     return {
         "timestamp": time.time(),
-        "polling_status": {
-            "active": is_polling,
-            "thread_alive": telemetry_thread.is_alive() if telemetry_thread else False,
-            "interval_seconds": 2.0,
-        },
-        "fleet_info": {
-            "fleet_name": fleet_config.fleet_name,
-            "total_drones": len(fleet_config.drones),
-            "active_drones": len(fleet_config.get_active_drones()),
-            "cached_drones": len(telemetry_cache),
-        },
-        "cache_details": cache_info,
-        "system_health": {
-            "cache_hit_rate": f"{(len(telemetry_cache) / max(len(fleet_config.get_active_drones()), 1) * 100):.1f}%",
-            "oldest_data_age": max(
-                [
-                    time.time() - data.get("server_timestamp", time.time())
-                    for data in telemetry_cache.values()
-                ],
-                default=0,
-            )
-            if telemetry_cache
-            else 0,
+        "drones": drones,
+        "summary": {
+            "successful": successful,
+            "failed": len(drones) - successful - inactive,
+            "inactive": inactive,
         },
     }
 
 
+async def _fetch_live_telemetry(drone_config) -> Dict[str, Any]:
+    """Fetch telemetry directly from a drone agent.
+
+    Responses younger than LIVE_TELEMETRY_TTL are reused, so dashboards and
+    tools polling the same drone in one tick share a single agent request.
+
+    Args:
+        drone_config: Configuration of the drone to query
+
+    Returns:
+        Telemetry data with server metadata; data_age_seconds is non-zero
+        when a reused response is served
+
+    Raises:
+        HTTPException: If the agent cannot be reached or returns an error
+    """
+    drone_id = drone_config.id
+    endpoint = drone_config.endpoint
+
+    cached = _live_telemetry_cache.get(drone_id)
+    if cached is not None:
+        age = time.monotonic() - cached[0]
+        if age < LIVE_TELEMETRY_TTL:
+            return {**cached[1], "data_age_seconds": age}
+
+    client = get_http_client(AGENT_POOL_LIMITS)
+    try:
+        response = await client.get(agent_url(endpoint, "/telemetry"), timeout=10.0)
+
+        if response.status_code == 200:
+            telemetry = decode_json(response.content)
+            if not isinstance(telemetry, dict):
+                raise ValueError("telemetry is not a JSON object")
+            telemetry.update(
+                {
+                    "server_timestamp": time.time(),
+                    "source": "live_request",
+                    "drone_endpoint": endpoint,
+                    "drone_name": drone_config.name,
+                    "drone_type": drone_config.type,
+                    "drone_location": drone_config.location,
+                    "data_age_seconds": 0.0,  # Fresh data
+                }
+            )
+            _live_telemetry_cache[drone_id] = (time.monotonic(), telemetry)
+            return telemetry
+        else:
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Drone {drone_config.name} returned error: {response.text}",
+            )
+
+    except httpx.TimeoutException:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Timeout waiting for drone {drone_id} ({drone_config.name}) telemetry",
+        )
+    except httpx.ConnectError:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Cannot connect to drone {drone_id} ({drone_config.name}) at {endpoint}",
+        )
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Communication error with drone {drone_id} ({drone_config.name}): {str(e)}",
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=502,
+            detail=f"Invalid telemetry from drone {drone_id} ({drone_config.name}): {str(e)}",
+        )
+
+
 @app.get("/api/schemas")
-async def get_all_command_schemas() -> Dict[str, Any]:
+def get_all_command_schemas() -> Dict[str, Any]:
     """Get all command schemas for N8N MCP integration."""
     return schemas_api.get_all_schemas()
 
 
 @app.get("/api/schemas/{schema_name}")
-async def get_command_schema(schema_name: str) -> Dict[str, Any]:
+def get_command_schema(schema_name: str) -> Dict[str, Any]:
     """Get specific command schema by name."""
     return schemas_api.get_schema(schema_name)
 
 
 @app.get("/api/schemas/mcp/tools")
-async def get_mcp_tools_definitions() -> Dict[str, Any]:
+def get_mcp_tools_definitions() -> Dict[str, Any]:
     """Get schemas optimized for MCP tool definitions."""
     return schemas_api.get_schemas_for_mcp()
 
 
 @app.post("/api/schemas/cache/clear")
-async def clear_schemas_cache() -> Dict[str, Any]:
+def clear_schemas_cache() -> Dict[str, Any]:
     """Clear schemas cache (development use)."""
     return schemas_api.clear_cache()
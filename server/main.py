@@ -26,7 +26,12 @@ def main():
     print("🎯 Fleet commands: http://localhost:8002/fleet/commands")
     print("-" * 50)
 
-    uvicorn.run(app, host="0.0.0.0", port=8002, log_level="info", access_log=True)
+    # "auto" selects uvloop when installed; DRONESPHERE_USE_UVLOOP=false forces asyncio
+    loop = "auto" if os.getenv("DRONESPHERE_USE_UVLOOP", "true").lower() == "true" else "asyncio"
+
+    uvicorn.run(
+        app, host="0.0.0.0", port=8002, loop=loop, log_level="info", access_log=True
+    )
 
 
 if __name__ == "__main__":
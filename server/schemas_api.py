@@ -14,6 +14,11 @@ from typing import Any, Dict, Optional
 import yaml
 from fastapi import HTTPException
 
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 class SchemasAPI:
     """Professional YAML schemas API with caching."""
@@ -48,8 +53,8 @@ class SchemasAPI:
     def _load_yaml_file(self, file_path: str, mtime: float) -> Dict[str, Any]:
         """Load YAML file with LRU cache (mtime for cache invalidation)."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            with open(file_path, 'rb') as f:
+                return yaml.load(f, Loader=YamlLoader)
         except yaml.YAMLError as e:
             raise HTTPException(status_code=500, detail=f"YAML parsing error: {str(e)}")
         except Exception as e:
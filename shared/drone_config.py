@@ -21,6 +21,35 @@ sys.path.insert(0, str(project_root))
 class DroneConfig:
     """Represents configuration for a single drone."""
 
+    # Loaded once per drone and read on every request; slots drop the per-instance __dict__
+    __slots__ = (
+        "raw_config",
+        "id",
+        "name",
+        "description",
+        "type",
+        "status",
+        "connection",
+        "ip",
+        "port",
+        "protocol",
+        "endpoint",
+        "full_endpoint",
+        "hardware",
+        "model",
+        "firmware",
+        "capabilities",
+        "max_altitude",
+        "max_speed",
+        "battery_capacity",
+        "metadata",
+        "location",
+        "origin_gps",
+        "team",
+        "priority",
+        "notes",
+    )
+
     def __init__(self, config_data: Dict[str, Any]):
         """Initialize drone configuration from dictionary."""
         self.raw_config = config_data
@@ -35,8 +64,9 @@ class DroneConfig:
         self.ip = self.connection["ip"]
         self.port = self.connection["port"]
         self.protocol = self.connection["protocol"]
-        # Auto-generate endpoint from ip:port
+        # Auto-generate endpoint from ip:port; URL forms are built once, not per request
         self.endpoint = f"{self.ip}:{self.port}"
+        self.full_endpoint = f"{self.protocol}://{self.endpoint}"
 
         # Hardware specifications
         self.hardware = config_data["hardware"]
@@ -70,11 +100,6 @@ class DroneConfig:
         """Check if drone is real hardware."""
         return self.type == "hardware"
 
-    @property
-    def full_endpoint(self) -> str:
-        """Get full HTTP endpoint URL."""
-        return f"{self.protocol}://{self.endpoint}"
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API responses."""
         return {
@@ -110,6 +135,7 @@ class FleetConfig:
         self.config_path = Path(config_path)
         self.config_data = self._load_config()
         self.drones = self._load_drones()
+        self._index_drones()
 
         # Fleet metadata
         self.fleet_info = self.config_data["fleet"]
@@ -140,21 +166,27 @@ class FleetConfig:
             drones[drone_config.id] = drone_config
         return drones
 
+    def _index_drones(self) -> None:
+        """Precompute the drone lists served by the get_*_drones accessors."""
+        self._active_drones = [drone for drone in self.drones.values() if drone.is_active]
+        self._simulation_drones = [drone for drone in self.drones.values() if drone.is_simulation]
+        self._hardware_drones = [drone for drone in self.drones.values() if drone.is_hardware]
+
     def get_drone(self, drone_id: int) -> Optional[DroneConfig]:
         """Get drone configuration by ID."""
         return self.drones.get(drone_id)
 
     def get_active_drones(self) -> List[DroneConfig]:
-        """Get list of active drones."""
-        return [drone for drone in self.drones.values() if drone.is_active]
+        """Get list of active drones (shared list, do not modify)."""
+        return self._active_drones
 
     def get_simulation_drones(self) -> List[DroneConfig]:
-        """Get list of simulation drones."""
-        return [drone for drone in self.drones.values() if drone.is_simulation]
+        """Get list of simulation drones (shared list, do not modify)."""
+        return self._simulation_drones
 
     def get_hardware_drones(self) -> List[DroneConfig]:
-        """Get list of hardware drones."""
-        return [drone for drone in self.drones.values() if drone.is_hardware]
+        """Get list of hardware drones (shared list, do not modify)."""
+        return self._hardware_drones
 
     def get_drones_by_team(self, team: str) -> List[DroneConfig]:
         """Get drones assigned to specific team."""
@@ -172,6 +204,7 @@ class FleetConfig:
         """Reload configuration from file (for dynamic updates)."""
         self.config_data = self._load_config()
         self.drones = self._load_drones()
+        self._index_drones()
         print(f"🔄 Reloaded drone configuration: {len(self.drones)} drones")
 
     def to_dict(self) -> Dict[str, Any]:
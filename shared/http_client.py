@@ -0,0 +1,41 @@
+"""Process-wide pooled HTTP client for DroneSphere services.
+
+One keep-alive connection pool is shared by every caller in a process, so
+requests to the server or agents reuse connections instead of opening a new
+one per call.
+
+Path: shared/http_client.py
+"""
+from typing import Optional
+
+import httpx
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=32, max_keepalive_connections=16, keepalive_expiry=60.0
+)
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client(limits: Optional[httpx.Limits] = None) -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use.
+
+    Args:
+        limits: Pool limits, applied only when the client is (re)created;
+            DEFAULT_LIMITS if omitted
+
+    Returns:
+        Process-wide AsyncClient
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(limits=limits or DEFAULT_LIMITS)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client if it was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -0,0 +1,341 @@
+"""Basic unit tests for DroneSphere components.
+
+Path: tests/test_basic.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+# Add project root and agent directory to Python path (as agent/main.py does)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "agent"))
+
+from agent.command_registry import CommandRegistry  # noqa: E402
+from agent.commands.base import BaseCommand  # noqa: E402
+from agent.commands.takeoff import TakeoffCommand  # noqa: E402
+from agent.executor import CommandExecutor  # noqa: E402
+from server import api  # noqa: E402
+from shared import http_client  # noqa: E402
+from shared.models import Command, CommandResult  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def registry():
+    """Command registry discovered from the repository's commands and schemas."""
+    command_registry = CommandRegistry()
+    command_registry.discover_and_register()
+    return command_registry
+
+
+# ============================================================================
+# COMMAND PARAMETER VALIDATION
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    "command_name, params",
+    [
+        ("takeoff", {"altitude": 10.0}),
+        ("goto", {"latitude": 47.398, "longitude": 8.546, "altitude": 503.0}),
+        ("goto", {"latitude": 47.398, "longitude": 8.546, "altitude": 503.0, "speed": 5.0}),
+        ("goto", {"north": 50, "east": 30, "down": -15, "acceptance_radius": 1.5}),
+        ("wait", {"duration": 2}),
+        ("wait", {"duration": 2.5, "message": "hold"}),
+        ("land", {}),
+        ("rtl", {}),
+    ],
+)
+def test_declared_params_accepted(registry, command_name, params):
+    """Parameters declared in a command's schema validate cleanly."""
+    assert registry.validate_params(command_name, params) == []
+
+
+@pytest.mark.parametrize(
+    "command_name, params, expected",
+    [
+        ("takeoff", {"altitude": 10.0, "speed": 2}, "root: Unknown parameter(s): speed"),
+        ("land", {"force": True}, "root: Unknown parameter(s): force"),
+        (
+            "goto",
+            {"north": 1, "east": 2, "down": -3, "yaw": 90, "heading": 0},
+            "root: Unknown parameter(s): heading, yaw",
+        ),
+    ],
+)
+def test_unknown_params_rejected(registry, command_name, params, expected):
+    """Parameters a schema does not declare are rejected with one clear message."""
+    assert registry.validate_params(command_name, params) == [expected]
+
+
+@pytest.mark.parametrize(
+    "command_name, params, fragment",
+    [
+        ("takeoff", {}, "'altitude' is a required property"),
+        ("takeoff", {"altitude": 500}, "altitude: 500 is greater than the maximum of 50.0"),
+        ("takeoff", {"altitude": "high"}, "altitude: 'high' is not of type 'number'"),
+        ("wait", {"duration": 0}, "duration: 0 is less than the minimum of 0.1"),
+        ("goto", {"latitude": 47.398, "longitude": 8.546}, "is not valid under any of"),
+    ],
+)
+def test_schema_errors_reported(registry, command_name, params, fragment):
+    """Schema violations still surface jsonschema's error messages."""
+    errors = registry.validate_params(command_name, params)
+    assert any(fragment in error for error in errors), errors
+
+
+# ============================================================================
+# COMMAND EXECUTOR
+# ============================================================================
+
+
+class _SlowCommand(BaseCommand):
+    """Command that outlives its executor deadline."""
+
+    timeout = 0.05
+
+    async def execute(self, backend) -> CommandResult:
+        await asyncio.sleep(1.0)
+        return CommandResult(success=True, message="finished late")
+
+
+def test_executor_times_out_slow_command(monkeypatch):
+    """A command running past its timeout fails with error="timeout" and is handled."""
+    command_registry = CommandRegistry()
+    command_registry.commands["slow"] = _SlowCommand
+    executor = CommandExecutor(backend=None, registry=command_registry)
+
+    handled = []
+
+    async def record_failure(cmd, reason):
+        handled.append((cmd.name, reason))
+        return True
+
+    monkeypatch.setattr(executor, "_handle_failure", record_failure)
+
+    results = asyncio.run(executor.execute_sequence([Command(name="slow", params={})]))
+
+    assert len(results) == 1
+    assert results[0].success is False
+    assert results[0].error == "timeout"
+    assert results[0].duration < 1.0
+    assert handled == [("slow", "failure")]
+    assert executor.is_executing() is False
+
+
+# ============================================================================
+# TAKEOFF CLIMB MONITORING
+# ============================================================================
+
+
+class _ReplayBackend:
+    """Backend stand-in replaying relative altitudes for the takeoff climb.
+
+    Streamed samples come from ``stream`` (None means no sample arrived in
+    time); the MAVSDK position subscription replays ``subscription``.
+    """
+
+    connected = True
+
+    def __init__(self, stream, subscription=()):
+        self.stream = list(stream)
+        self.subscription = list(subscription)
+        self.subscription_reads = 0
+        self.drone = SimpleNamespace(
+            action=SimpleNamespace(
+                arm=self._noop, set_takeoff_altitude=self._noop, takeoff=self._noop
+            ),
+            telemetry=SimpleNamespace(position=self._position),
+        )
+
+    async def _noop(self, *args):
+        pass
+
+    async def _position(self):
+        self.subscription_reads += 1
+        for altitude in self.subscription:
+            yield SimpleNamespace(relative_altitude_m=altitude)
+        await asyncio.Event().wait()  # Subscription stays open without new samples
+
+    def get_cached_position(self):
+        return {"relative_altitude": 0.0}
+
+    async def wait_for_position(self, timeout):
+        if self.stream:
+            altitude = self.stream.pop(0)
+            return None if altitude is None else {"relative_altitude": altitude}
+        await asyncio.sleep(timeout)
+        return None
+
+
+def test_takeoff_completes_from_streamed_samples():
+    """Takeoff succeeds once a streamed sample reaches the target altitude."""
+    backend = _ReplayBackend(stream=[1.0, 4.0, 7.5, 9.6])
+
+    result = asyncio.run(TakeoffCommand("takeoff", {"altitude": 10.0}).execute(backend))
+
+    assert result.success is True, result.message
+    assert backend.stream == []
+    assert backend.subscription_reads == 0
+
+
+def test_takeoff_falls_back_to_subscription_without_samples():
+    """With the telemetry stream silent, the climb is read from MAVSDK directly."""
+    backend = _ReplayBackend(stream=[2.0, None], subscription=[9.8])
+
+    result = asyncio.run(TakeoffCommand("takeoff", {"altitude": 10.0}).execute(backend))
+
+    assert result.success is True, result.message
+    assert backend.subscription_reads == 1
+
+
+def test_takeoff_times_out_below_target(monkeypatch):
+    """A climb that never reaches the target altitude fails with error="timeout"."""
+    monkeypatch.setattr(TakeoffCommand, "CLIMB_TIMEOUT", 0.2)
+    monkeypatch.setattr(TakeoffCommand, "POSITION_SAMPLE_TIMEOUT", 0.05)
+    backend = _ReplayBackend(stream=[1.0, 2.0, None], subscription=[3.0])
+
+    result = asyncio.run(TakeoffCommand("takeoff", {"altitude": 10.0}).execute(backend))
+
+    assert result.success is False
+    assert result.error == "timeout"
+    assert backend.subscription_reads >= 1
+
+
+# ============================================================================
+# FLEET TELEMETRY POLLING
+# ============================================================================
+
+
+@pytest.fixture
+def poll_state():
+    """Isolate the server's telemetry cache and polling backoff between tests."""
+    api.telemetry_cache.clear()
+    api._poll_backoff.clear()
+    yield
+    api.telemetry_cache.clear()
+    api._poll_backoff.clear()
+
+
+def _poll_once(drone_config, handler):
+    """Run one telemetry poll of a drone against a mock agent."""
+
+    async def poll():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            request = client.build_request("GET", f"{drone_config.endpoint}/telemetry")
+            await api._poll_drone_telemetry(client, asyncio.Semaphore(1), drone_config, request)
+
+    asyncio.run(poll())
+
+
+def test_poll_backoff_grows_and_resets(poll_state):
+    """Failed polls double a drone's retry delay up to the cap; a success clears it."""
+    drone_config = SimpleNamespace(
+        id=7, endpoint="http://127.0.0.1:9", name="Test", type="sitl", location="lab"
+    )
+
+    def unreachable(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    expected_delays = [4.0, 8.0, 16.0, 32.0, 60.0, 60.0]
+    for failures, expected in enumerate(expected_delays, start=1):
+        before = time.time()
+        _poll_once(drone_config, unreachable)
+        count, retry_at = api._poll_backoff[drone_config.id]
+        assert count == failures
+        assert retry_at - before == pytest.approx(expected, abs=0.5)
+
+    assert api.telemetry_cache[drone_config.id]["error"] == "Connection refused"
+
+    _poll_once(drone_config, lambda request: httpx.Response(200, json={"armed": False}))
+
+    assert drone_config.id not in api._poll_backoff
+    assert api.telemetry_cache[drone_config.id]["source"] == "polling"
+
+
+def test_telemetry_status_reports_backoff(poll_state):
+    """The polling status endpoint shows which drones the poller is backing off."""
+    now = time.time()
+    api.telemetry_cache[1] = {"drone_name": "Alpha", "server_timestamp": now}
+    api.telemetry_cache[2] = {
+        "drone_name": "Bravo",
+        "server_timestamp": now,
+        "source": "connection_error",
+        "error": "Connection refused",
+    }
+    api._poll_backoff[2] = (3, now + 16.0)
+
+    response = TestClient(api.app).get("/fleet/telemetry/status")
+
+    assert response.status_code == 200
+    status = response.json()
+    assert status["polling_status"]["backed_off_drones"] == [2]
+    assert status["cache_details"]["1"]["backoff"] is None
+    backoff = status["cache_details"]["2"]["backoff"]
+    assert backoff["failures"] == 3
+    assert 15.0 < backoff["retry_in_seconds"] <= 16.0
+
+
+# ============================================================================
+# LIVE FLEET TELEMETRY
+# ============================================================================
+
+
+@pytest.fixture
+def live_agents(monkeypatch):
+    """Route agent requests to a mock agent and record which endpoints were hit."""
+    requested = []
+
+    def agent(request):
+        requested.append(request.url.host)
+        return httpx.Response(200, json={"armed": False, "battery": {"remaining_percent": 90}})
+
+    monkeypatch.setattr(
+        http_client,
+        "_http_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(agent)),
+    )
+    monkeypatch.setattr(api, "_live_telemetry_cache", {})
+    return requested
+
+
+def test_live_fleet_telemetry_reports_each_drone(live_agents):
+    """Active drones are queried; inactive and unknown ones are reported, not queried."""
+    response = TestClient(api.app).post("/fleet/telemetry/live", json={"drone_ids": [1, 2, 99]})
+
+    assert response.status_code == 200
+    body = response.json()
+    drones = body["drones"]
+
+    assert drones["1"]["source"] == "live_request"
+    assert drones["1"]["armed"] is False
+    assert drones["2"] == {
+        "status": "inactive",
+        "error": "Drone marked as inactive in configuration",
+    }
+    assert drones["99"]["status_code"] == 404
+    assert body["summary"] == {"successful": 1, "failed": 1, "inactive": 1}
+    assert live_agents == ["127.0.0.1"]
+
+
+def test_live_fleet_telemetry_defaults_to_active_drones(live_agents):
+    """Omitting drone_ids queries every active drone."""
+    response = TestClient(api.app).post("/fleet/telemetry/live", json={})
+
+    assert response.status_code == 200
+    assert list(response.json()["drones"]) == ["1"]
+    assert len(live_agents) == 1
+
+
+def test_live_fleet_telemetry_rejects_non_list_ids(live_agents):
+    """A drone_ids value that is not a list of integers is rejected up front."""
+    response = TestClient(api.app).post("/fleet/telemetry/live", json={"drone_ids": "x"})
+
+    assert response.status_code == 422
+    assert live_agents == []